@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import random
+import sys
+from typing import TYPE_CHECKING
 
 import pygame as pg
+from loguru import logger
 
 from src import geometry
 from src.ai import AI
 from src.camera import Camera
 from src.constants import (
+    FRAME_RATE,
     MAP_HEIGHT,
     MAP_WIDTH,
     PRODUCTION_INTERFACE_WIDTH,
@@ -18,19 +22,66 @@ from src.constants import (
 )
 from src.fog_of_war import FogOfWar
 from src.game import Game
+from src.game_objects.buildings.barracks import Barracks
+from src.game_objects.buildings.building import Building
 from src.game_objects.buildings.headquarters import Headquarters
+from src.game_objects.buildings.power_plant import PowerPlant
 from src.game_objects.buildings.turret import Turret
+from src.game_objects.buildings.war_factory import WarFactory
+from src.game_objects.units import UnitType
 from src.game_objects.units.harvester import Harvester
 from src.game_objects.units.infantry import Infantry
+from src.game_objects.units.tank import Tank
 from src.geometry import Coordinate
 from src.iron_field import IronField
+from src.particle import ParticlePool
 from src.player_interface import PlayerInterface
 from src.team import Faction, Team
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.game_objects.game_object import GameObject
+
+
+def make_base_map() -> pg.Surface:
+    """Return a new map background with a random grass texture.
+
+    Each tile's shade is one pixel of a tile-resolution image, scaled up to map
+    size in one call rather than drawing every tile.
+    """
+    columns, rows = MAP_WIDTH // TILE_SIZE, MAP_HEIGHT // TILE_SIZE
+    pixels = bytearray(columns * rows * 3)
+    pixels[1::3] = bytes(random.randint(100, 150) for _ in range(columns * rows))
+    tiles = pg.image.frombytes(bytes(pixels), (columns, rows), "RGB")
+    base_map = pg.transform.scale(tiles, (MAP_WIDTH, MAP_HEIGHT))
+    for x in range(TILE_SIZE // 2, MAP_WIDTH, TILE_SIZE):
+        for y in range(TILE_SIZE // 2, MAP_HEIGHT, TILE_SIZE):
+            if random.random() < 0.1:
+                pg.draw.circle(
+                    base_map, (0, 80, 0), (x, y), TILE_SIZE // 4
+                )  # Dark spots
+
+    return base_map
+
+
+def draw_objects(*, surface_: pg.Surface, objects: Iterable[GameObject]) -> None:
+    """Draw `objects` to `surface_`: all images in one batch, then overlays on top.
+
+    Accesses global state.
+    """
+    # Same translation for every object, so read the offset once
+    offset = camera.map_offset
+    screen_rects = [(o, o.rect.move(offset)) for o in objects]
+    surface_.fblits([(o.image, rect.topleft) for o, rect in screen_rects])
+    for o, rect in screen_rects:
+        o.draw_overlays(surface=surface_, screen_rect=rect)
+
 
 def draw(*, surface_: pg.Surface, game_: Game) -> None:
     """Draw entire game to `surface_`.
 
+    Only `GameObject`s within the camera viewport are drawn.
     Accesses global state.
     """
     surface_.fill(pg.Color("black"))
@@ -41,36 +92,37 @@ def draw(*, surface_: pg.Surface, game_: Game) -> None:
         ):
             iron_field.draw(surface=surface_, camera=camera)
 
-    for building in game_.buildings:
-        if (
-            building.team == player_team
-            or building.is_explored
-            or VIEW_DEBUG_MODE_IS_ENABLED
-        ):
-            building.draw(surface=surface_, camera=camera)
+    on_screen_objects = game_.objects_in_rect(camera.viewport)
+    draw_objects(
+        surface_=surface_,
+        objects=(
+            o
+            for o in on_screen_objects
+            if isinstance(o, Building)
+            and (o.team == player_team or o.is_explored or VIEW_DEBUG_MODE_IS_ENABLED)
+        ),
+    )
 
     if not VIEW_DEBUG_MODE_IS_ENABLED:
         fog_of_war.draw(surface=surface_, camera=camera)
 
-    for unit in game_.units:
-        if (
-            unit.team == player_team
-            or fog_of_war.is_visible(unit.position)
-            or VIEW_DEBUG_MODE_IS_ENABLED
-        ):
-            unit.draw(surface=surface_, camera=camera)
+    on_screen_units = [o for o in on_screen_objects if isinstance(o, UnitType)]
+    on_screen_projectiles = camera.viewport.collideobjectsall(projectiles.sprites())
+    if not VIEW_DEBUG_MODE_IS_ENABLED:
+        on_screen_units = fog_of_war.visible_objects(on_screen_units, team=player_team)
+        on_screen_projectiles = fog_of_war.visible_objects(
+            on_screen_projectiles, team=player_team
+        )
 
-    for projectile in projectiles:
-        if (
-            projectile.team == player_team
-            or fog_of_war.is_visible(projectile.position)
-            or VIEW_DEBUG_MODE_IS_ENABLED
-        ):
-            projectile.draw(surface=surface_, camera=camera)
+    draw_objects(surface_=surface_, objects=on_screen_units)
+    for projectile in on_screen_projectiles:
+        projectile.draw(surface=surface_, camera=camera)
 
-    for particle in particles:
-        if fog_of_war.is_visible(particle.position) or VIEW_DEBUG_MODE_IS_ENABLED:
-            particle.draw(surface=surface_, camera=camera)
+    particles.draw(
+        surface=surface_,
+        camera=camera,
+        fog_of_war=None if VIEW_DEBUG_MODE_IS_ENABLED else fog_of_war,
+    )
 
     interface.draw(surface=surface_, game=game, camera=camera)
     if selecting and select_rect:
@@ -79,12 +131,26 @@ def draw(*, surface_: pg.Surface, game_: Game) -> None:
 
 if __name__ == "__main__":
     pg.init()
-    screen = pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # AI debug messages are logged many times a second. Release builds drop them
+    # before they are formatted.
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if VIEW_DEBUG_MODE_IS_ENABLED else "INFO")
+    # Release builds let the display's vsync pace frames where available. Debug
+    # builds busy-wait instead, for lower-jitter frame times.
+    vsync_is_enabled = not VIEW_DEBUG_MODE_IS_ENABLED
+    try:
+        screen = pg.display.set_mode(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), vsync=int(vsync_is_enabled)
+        )
+    except pg.error:
+        vsync_is_enabled = False
+        screen = pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
     clock = pg.time.Clock()
     base_font = pg.font.SysFont(None, 24)
 
     projectiles: pg.sprite.Group = pg.sprite.Group()
-    particles: pg.sprite.Group = pg.sprite.Group()
+    particles = ParticlePool()
 
     player_team = Team(faction=Faction.GDI, iron=1500)
     ai_team = Team(faction=Faction.NOD, iron=1500)
@@ -96,23 +162,21 @@ if __name__ == "__main__":
     _nod_hq_pos = _map_bottom_right - _hq_offset_from_corner
     gdi_hq = Headquarters(position=_gdi_hq_pos, team=player_team, font=base_font)
     nod_hq = Headquarters(position=_nod_hq_pos, team=ai_team, font=base_font)
-    game.objects.add(gdi_hq)
-    game.objects.add(nod_hq)
-    interface = PlayerInterface(
-        team=player_team, hq=gdi_hq, all_buildings=game.buildings, font=base_font
-    )
+    game.add_object(gdi_hq)
+    game.add_object(nod_hq)
+    interface = PlayerInterface(team=player_team, hq=gdi_hq, game=game, font=base_font)
     ai = AI(team=ai_team, opposing_team=player_team, hq=nod_hq)
 
     for i in range(3):
         _infantry_spawn_offset = Coordinate(50, 0) + i * Coordinate(20, 0)
-        game.objects.add(
+        game.add_object(
             Infantry(position=_gdi_hq_pos + _infantry_spawn_offset, team=player_team)
         )
-        game.objects.add(
+        game.add_object(
             Infantry(position=_nod_hq_pos + _infantry_spawn_offset, team=ai_team)
         )
 
-    game.objects.add(
+    game.add_object(
         Harvester(
             position=_gdi_hq_pos + (100, 100),
             team=player_team,
@@ -120,7 +184,7 @@ if __name__ == "__main__":
             font=base_font,
         )
     )
-    game.objects.add(
+    game.add_object(
         Harvester(
             position=_nod_hq_pos + (100, 100),
             team=ai_team,
@@ -141,26 +205,14 @@ if __name__ == "__main__":
 
     selecting = False
     select_start = None
-    select_rect = None
+    select_rect = pg.Rect(0, 0, 0, 0)  # Screen space; updated in place while dragging
     camera = Camera(
         pg.Rect(
             (0, 0),
             (SCREEN_WIDTH - PRODUCTION_INTERFACE_WIDTH, SCREEN_HEIGHT),
         )
     )
-    base_map = pg.Surface((MAP_WIDTH, MAP_HEIGHT))
-    # Improved map with grass texture
-    for x in range(0, MAP_WIDTH, TILE_SIZE):
-        for y in range(0, MAP_HEIGHT, TILE_SIZE):
-            color = (0, random.randint(100, 150), 0)
-            pg.draw.rect(base_map, color, (x, y, TILE_SIZE, TILE_SIZE))
-            if random.random() < 0.1:
-                pg.draw.circle(
-                    base_map,
-                    (0, 80, 0),
-                    (x + TILE_SIZE // 2, y + TILE_SIZE // 2),
-                    TILE_SIZE // 4,
-                )  # Dark spots
+    base_map = make_base_map().convert()  # Match display format, for faster blits
 
     running = True
     while running:
@@ -188,16 +240,15 @@ if __name__ == "__main__":
                     if interface.handle_click(screen_pos=event.pos, game=game):
                         continue
 
-                    for b in game.buildings:
-                        b.is_selected = False
+                    # Only the selected building can have `is_selected` set
+                    if game.selected_building:
+                        game.selected_building.is_selected = False
 
                     clicked_building = next(
                         (
-                            b
-                            for b in game.team_buildings(player_team)
-                            if camera.rect_to_screen(b.rect).collidepoint(
-                                target_x, target_y
-                            )
+                            o
+                            for o in game.objects_at(world_pos)
+                            if isinstance(o, Building) and o.team == player_team
                         ),
                         None,
                     )
@@ -208,51 +259,30 @@ if __name__ == "__main__":
                         game.selected_building = None
                         selecting = True
                         select_start = event.pos
-                        select_rect = pg.Rect(target_x, target_y, 0, 0)
+                        select_rect.update(target_x, target_y, 0, 0)
 
                 elif event.button == 3:
                     if gdi_hq.pending_building:
                         gdi_hq.pending_building = gdi_hq.pending_building_pos = None
                         if gdi_hq.production_queue and gdi_hq.has_enough_power:
-                            gdi_hq.production_timer = game.get_production_time(
-                                cls=gdi_hq.production_queue[0],
-                                team=player_team,
-                            )
+                            gdi_hq.start_production(game=game)
                         continue
                     clicked_field = next(
-                        (
-                            f
-                            for f in game.iron_fields
-                            if camera.rect_to_screen(f.rect).collidepoint(
-                                target_x, target_y
-                            )
-                        ),
+                        (f for f in game.iron_fields if f.rect.collidepoint(world_pos)),
                         None,
                     )
+                    clicked_objects = [
+                        o for o in game.objects_at(world_pos) if o.team == ai_team
+                    ]
                     clicked_enemy_unit = next(
-                        (
-                            u
-                            for u in game.team_units(ai_team)
-                            if camera.rect_to_screen(u.rect).collidepoint(
-                                target_x, target_y
-                            )
-                        ),
+                        (o for o in clicked_objects if not isinstance(o, Building)),
                         None,
                     )
                     clicked_enemy_building = next(
-                        (
-                            b
-                            for b in game.team_buildings(ai_team)
-                            if camera.rect_to_screen(b.rect).collidepoint(
-                                target_x, target_y
-                            )
-                        ),
+                        (o for o in clicked_objects if isinstance(o, Building)),
                         None,
                     )
                     if game.selected_units:
-                        group_center = geometry.mean_vector(
-                            [u.position for u in game.selected_units]
-                        )
                         formation_positions = geometry.calculate_formation_positions(
                             center=world_pos,
                             target=world_pos,
@@ -278,7 +308,7 @@ if __name__ == "__main__":
                     raise TypeError("No selection rect start point")
                     # Temporary handling, review later
 
-                select_rect = pg.Rect(
+                select_rect.update(
                     min(select_start[0], current_pos[0]),
                     min(select_start[1], current_pos[1]),
                     abs(current_pos[0] - select_start[0]),
@@ -290,7 +320,8 @@ if __name__ == "__main__":
                     # Temporary handling, review later
 
                 selecting = False
-                for unit in game.team_units(player_team):
+                selectable_units = game.team_units(player_team)
+                for unit in selectable_units:
                     unit.is_selected = False
 
                 game.selected_units.clear()
@@ -302,70 +333,51 @@ if __name__ == "__main__":
                     abs(world_end[0] - world_start[0]),
                     abs(world_end[1] - world_start[1]),
                 )
-                for unit in game.team_units(player_team):
-                    if world_rect.colliderect(unit.rect):
-                        unit.is_selected = True
-                        game.selected_units.add(unit)
+                for unit in world_rect.collideobjectsall(selectable_units):
+                    unit.is_selected = True
+                    game.selected_units.add(unit)
 
         camera.update(selected_units=game.selected_units, mouse_pos=pg.mouse.get_pos())
-        for unit in game.units:
-            if isinstance(unit, Harvester):
-                if unit.team == player_team:
-                    unit.update(
-                        enemy_units=game.team_units(ai_team),
-                        iron_fields=game.iron_fields,
-                    )
-                else:
-                    unit.update(
-                        enemy_units=game.team_units(player_team),
-                        iron_fields=game.iron_fields,
-                    )
-            else:
-                unit.update()
-
+        teams = player_team, ai_team
+        for team in teams:
+            for harvester in game.team_objects(team, Harvester):
+                harvester.update(game=game)
+            for combat_unit in (
+                *game.team_objects(team, Infantry),
+                *game.team_objects(team, Tank),
+            ):
+                combat_unit.update()
+
+        # Harvester and building targeting, collisions and attacks query the index
+        # for units' new positions
+        game.spatial_index.refresh()
         game.iron_fields.update()
-        for building in game.buildings:
-            if isinstance(building, Headquarters):
-                building.update(particles=particles, game=game)
-
-            elif isinstance(building, Turret):
-                if building.team == player_team:
-                    _opposing_team = ai_team
-                else:
-                    _opposing_team = player_team
-
-                    building.update(
-                        particles=particles,
-                        projectiles=projectiles,
-                        enemy_units=game.team_units(_opposing_team),
-                    )
-            else:
-                building.update(particles=particles)
-
-        projectiles.update(particles)
+        for team in teams:
+            for harvester in game.team_objects(team, Harvester):
+                harvester.attack(game=game)
+            for hq in game.team_objects(team, Headquarters):
+                hq.update(particles=particles, game=game)
+            for turret in game.team_objects(team, Turret):
+                turret.update(particles=particles, projectiles=projectiles, game=game)
+            for building_cls in (Barracks, PowerPlant, WarFactory):
+                for building in game.team_objects(team, building_cls):
+                    building.update(particles=particles)
+
+        projectiles.update(particles, game.frame_count)
         particles.update()
         game.handle_collisions()
-        game.handle_attacks(
-            team=player_team,
-            opposing_team=ai_team,
-            projectiles=projectiles,
-            particles=particles,
-        )
-        game.handle_attacks(
-            team=ai_team,
-            opposing_team=player_team,
-            projectiles=projectiles,
-            particles=particles,
-        )
+        game.spatial_index.refresh()
+        game.handle_attacks(projectiles=projectiles, particles=particles)
         game.handle_projectiles(projectiles=projectiles, particles=particles)
-        ai.update(game=game, iron_fields=game.iron_fields)
+        ai.update(game=game)
         # AI units and buildings are indirectly manipulated here
         fog_of_war.update(
             units=game.team_units(player_team),
             buildings=game.team_buildings(player_team),
         )
         for building in game.team_buildings(ai_team):
-            if fog_of_war.is_explored(building.position):
+            # Once explored, always explored
+            if not building.is_explored and fog_of_war.is_explored(building.position):
                 building.is_explored = True
 
         draw(surface_=screen, game_=game)
@@ -373,6 +385,13 @@ if __name__ == "__main__":
             unit.under_attack = False
 
         pg.display.flip()
-        clock.tick(60)
+        if VIEW_DEBUG_MODE_IS_ENABLED:
+            clock.tick_busy_loop(FRAME_RATE)
+        else:
+            # With vsync, `flip()` has usually already waited, and this only caps
+            # displays refreshing faster than `FRAME_RATE`.
+            clock.tick(FRAME_RATE)
+
+        game.frame_count += 1
 
     pg.quit()
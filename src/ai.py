@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import math
 import random
+from collections import deque
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
-from typing import TYPE_CHECKING, Literal
+from itertools import islice
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 from loguru import logger
 
@@ -18,21 +19,85 @@ from src.game_objects.buildings.headquarters import Headquarters
 from src.game_objects.buildings.power_plant import PowerPlant
 from src.game_objects.buildings.turret import Turret
 from src.game_objects.buildings.war_factory import WarFactory
+from src.game_objects.game_object import GameObject
 from src.game_objects.units.harvester import Harvester
 from src.game_objects.units.infantry import Infantry
 from src.game_objects.units.tank import Tank
 from src.geometry import Coordinate
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from src.game import Game
     from src.game_objects.buildings.building import Building
-    from src.game_objects.game_object import GameObject
     from src.iron_field import IronField
     from src.team import Team
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _ProductionContext:
+    """Per-tick inputs to `AI.PRODUCTION_RULES`."""
+
+    current: dict[str, int]
+    desired: dict[str, int]
+    harvester_cap: int
+    """Harvester count to stay below while defending."""
+    total_military: int
+    has_barracks: bool
+    has_warfactory: bool
+
+
+def _needs_infantry(c: _ProductionContext) -> bool:
+    return c.has_barracks and c.current["infantry"] < c.desired["infantry"]
+
+
+def _needs_tank(c: _ProductionContext) -> bool:
+    return c.has_warfactory and c.current["tank"] < c.desired["tank"]
+
+
+def _needs_turret(c: _ProductionContext) -> bool:
+    return c.current["turret"] < c.desired["turret"]
+
+
+def _needs_power_plant(c: _ProductionContext) -> bool:
+    return c.current["power_plant"] < c.desired["power_plant"]
+
+
+def _early_military_weight(c: _ProductionContext) -> int:
+    """Return weight multiplier for infantry and tanks while expanding, favoring
+    them until there is some military."""
+    return 2 if c.total_military < 6 else 1
+
+
+_AIState = Literal["AGGRESSIVE", "ATTACKED", "BROKE", "BUILD_UP", "THREATENED"]
+_ProductionRules = tuple[
+    tuple[type["GameObject"], "Callable[[_ProductionContext], float]"], ...
+]
+_EXPANSION_RULES: _ProductionRules = (
+    (Infantry, lambda c: _needs_infantry(c) * _early_military_weight(c)),
+    (Tank, lambda c: _needs_tank(c) * _early_military_weight(c)),
+    (Turret, _needs_turret),
+    (
+        Harvester,
+        lambda c: c.has_warfactory and c.current["harvester"] < c.desired["harvester"],
+    ),
+    (PowerPlant, _needs_power_plant),
+    (Barracks, lambda c: c.current["barracks"] < 2 and c.total_military >= 6),
+    (WarFactory, lambda c: c.current["war_factory"] < 2 and c.total_military >= 6),
+    (Headquarters, lambda c: c.current["harvester"] >= 2),
+)
+_DEFENSE_RULES: _ProductionRules = (
+    (Turret, _needs_turret),
+    (Tank, _needs_tank),
+    (Infantry, _needs_infantry),
+    (
+        Harvester,
+        lambda c: c.has_warfactory and c.current["harvester"] < c.harvester_cap,
+    ),
+    (PowerPlant, _needs_power_plant),
+)
+
+
 @dataclass(kw_only=True)
 class AI:
     DESIRED_UNIT_RATIO = {"harvester": 4, "infantry": 6, "tank": 3, "turret": 3}
@@ -42,6 +107,24 @@ class AI:
     SCOUT_INTERVAL = 200
     THREAT_RANGE = 500
     """THREATENED state allowed if any enemy unit is within this distance."""
+    PRIORITY_TARGET_RANGE = 250
+    """Attack waves only target enemies within this distance."""
+    _DAMAGED_UNIT_TARGET_PRIORITY = 1.5
+    """Replaces the default `TARGET_PRIORITY` of units below 30% health."""
+    _MAX_TARGET_PRIORITY = 3
+    PLACEMENT_OFFSETS = tuple(
+        (cos_a * 120, sin_a * 120)
+        for cos_a, sin_a in map(geometry.unit_vector, range(0, 360, 20))
+    )
+    """Candidate new building positions, relative to existing buildings."""
+    PRODUCTION_RULES: ClassVar[dict[_AIState, _ProductionRules]] = {
+        "BUILD_UP": _EXPANSION_RULES,
+        "AGGRESSIVE": _EXPANSION_RULES,
+        "ATTACKED": _DEFENSE_RULES,
+        "THREATENED": _DEFENSE_RULES,
+    }
+    """Production options by state, as classes and weight functions. One affordable
+    class with non-zero weight is picked at random, in proportion to weight."""
 
     team: Team
     opposing_team: Team
@@ -50,42 +133,45 @@ class AI:
     wave_timer: int = dataclass_field(init=False, default=0)
     wave_interval: int = dataclass_field(init=False)
     wave_number: int = dataclass_field(init=False, default=0)
-    state: Literal["AGGRESSIVE", "ATTACKED", "BROKE", "BUILD_UP", "THREATENED"] = (
-        dataclass_field(init=False, default="BUILD_UP")
-    )
+    state: _AIState = dataclass_field(init=False, default="BUILD_UP")
     defense_cooldown: int = dataclass_field(init=False, default=0)
-    scout_targets: list[Coordinate] = dataclass_field(init=False, default_factory=list)
+    scout_targets: deque[Coordinate] = dataclass_field(
+        init=False, default_factory=deque
+    )
     iron_income_rate: float = dataclass_field(init=False, default=0)
     last_scout_update: int = dataclass_field(init=False, default=0)
     surprise_attack_cooldown: int = dataclass_field(init=False, default=0)
+    _base_desired_units: dict[str, int] = dataclass_field(init=False)
+    """`DESIRED_UNIT_RATIO` scaled by `SCALE_FACTOR`."""
 
     def __post_init__(self) -> None:
-        self.wave_interval = random.randint(150, 250)
+        self._base_desired_units = {
+            key: int(ratio * AI.SCALE_FACTOR)
+            for key, ratio in AI.DESIRED_UNIT_RATIO.items()
+        }
+        self.wave_interval = AI._random_wave_interval()
 
     @staticmethod
-    def _enemy_unit_counts(
-        *, enemy_units: Iterable[GameObject], enemy_buildings: Iterable[Building]
-    ) -> dict[str, int]:
+    def _random_wave_interval() -> int:
+        """Return a random number of frames between waves, 150 to 250 inclusive.
+
+        Scales `random.random()` directly, as `random.randint()` is much slower.
+        """
+        return 150 + int(random.random() * 101)
+
+    def _enemy_unit_counts(self, *, game: Game) -> dict[str, int]:
         return {
-            "harvester": len([u for u in enemy_units if isinstance(u, Harvester)]),
-            "tank": len([u for u in enemy_units if isinstance(u, Tank)]),
-            "infantry": len([u for u in enemy_units if isinstance(u, Infantry)]),
-            "turret": len([b for b in enemy_buildings if isinstance(b, Turret)]),
+            "harvester": game.team_count(self.opposing_team, Harvester),
+            "tank": game.team_count(self.opposing_team, Tank),
+            "infantry": game.team_count(self.opposing_team, Infantry),
+            "turret": game.team_count(self.opposing_team, Turret),
         }
 
-    def _determine_state(
-        self,
-        *,
-        friendly_units: Iterable[GameObject],
-        enemy_units: Iterable[GameObject],
-        enemy_buildings_count: int,
-    ) -> None:
-        _player_base_size = len(list(enemy_units)) + enemy_buildings_count
+    def _determine_state(self, *, game: Game) -> None:
+        _player_base_size = game.team_count(self.opposing_team, GameObject)
+        harvesters = game.team_objects(self.team, Harvester)
         self.iron_income_rate = (
-            sum(h.iron for h in friendly_units if isinstance(h, Harvester))
-            / max(1, len([h for h in friendly_units if isinstance(h, Harvester)]))
-            * 60
-            / 40
+            sum(h.iron for h in harvesters) / max(1, len(harvesters)) * 60 / 40
         )
         previous_state = self.state
         self.state = (
@@ -94,39 +180,38 @@ class AI:
             else "ATTACKED"
             if self.hq.health < self.hq.max_health * 0.6 or self.defense_cooldown > 0
             else "THREATENED"
-            if any(
-                u.distance_to(self.hq.position) < AI.THREAT_RANGE for u in enemy_units
+            if game.enemy_units_within(
+                team=self.team, position=self.hq.position, radius=AI.THREAT_RANGE
             )
             else "AGGRESSIVE"
             if self.wave_number >= 2 or _player_base_size > 8
             else "BUILD_UP"
         )
         if self.state != previous_state:
-            logger.debug(f"AI state {previous_state} -> {self.state}")
+            logger.debug("AI state {} -> {}", previous_state, self.state)
+
+    def _enemy_hq(self, *, game: Game) -> Headquarters | None:
+        return next(iter(game.team_objects(self.opposing_team, Headquarters)), None)
 
     def _update_scouting(
         self,
         *,
-        friendly_units: Iterable[GameObject],
-        enemy_buildings: Iterable[Building],
+        game: Game,
         iron_fields: Iterable[IronField],
     ) -> None:
         if self.last_scout_update <= 0:
             if not self.scout_targets:
-                self.scout_targets = [f.position for f in iron_fields]
+                self.scout_targets = deque(f.position for f in iron_fields)
                 self.scout_targets.append(Coordinate(MAP_WIDTH // 2, MAP_HEIGHT // 2))
-                gdi_hq = next(
-                    (b for b in enemy_buildings if isinstance(b, Headquarters)),
-                    None,
-                )
+                gdi_hq = self._enemy_hq(game=game)
                 if gdi_hq:
                     self.scout_targets.append(gdi_hq.position)
 
-            for scout in [
-                u for u in friendly_units if isinstance(u, Infantry) and not u.target
-            ][:3]:
+            for scout in islice(
+                (u for u in game.team_objects(self.team, Infantry) if not u.target), 3
+            ):
                 if self.scout_targets:
-                    scout.target = self.scout_targets.pop(0)
+                    scout.target = self.scout_targets.popleft()
                     scout.target_object = None
 
             self.last_scout_update = AI.SCOUT_INTERVAL
@@ -138,41 +223,54 @@ class AI:
     def _determine_priority_target(
         *,
         unit: Infantry | Tank,
-        enemy_units: Iterable[GameObject],
-        enemy_buildings: Iterable[Building],
+        game: Game,
     ) -> Building | GameObject | None:
-        """Return a target object for `unit`, or None."""
-        targets = []
-        for enemy_unit in enemy_units:
-            if enemy_unit.health > 0:
-                dist = unit.distance_to(enemy_unit.position)
-                priority = (
-                    3
-                    if isinstance(enemy_unit, Harvester)
-                    else 2.5
-                    if isinstance(enemy_unit, Headquarters)
-                    else 2
-                    if isinstance(enemy_unit, Turret)
-                    else 1.5
-                    if enemy_unit.health / enemy_unit.max_health < 0.3
-                    else 1
-                )
-                targets.append((enemy_unit, dist, priority))
-
-        for enemy_building in enemy_buildings:
-            if enemy_building.health > 0:
-                dist = unit.distance_to(enemy_building.position)
-                priority = (
-                    2.5
-                    if isinstance(enemy_building, Headquarters)
-                    else 2
-                    if isinstance(enemy_building, Turret)
-                    else 1
-                )
-                targets.append((enemy_building, dist, priority))
+        """Return a target object for `unit`, or None.
+
+        The target is the enemy with the lowest distance / priority, if it is within
+        `PRIORITY_TARGET_RANGE`.
+
+        Only enemies within `PRIORITY_TARGET_RANGE * _MAX_TARGET_PRIORITY` are
+        considered, found via `game.spatial_index`. Any farther enemy ranks behind
+        every enemy within `PRIORITY_TARGET_RANGE`, so can't change the result.
+        """
+        unit_x, unit_y = unit.rect.center
+        faction = unit.team.faction
+        max_priority_sq = AI._MAX_TARGET_PRIORITY**2
+        # Key is (distance / priority) squared, which orders the same way
+        best_target: GameObject | None = None
+        best_dist_sq, best_key = 0, float("inf")
+        # Squared distance beyond which no priority can beat `best_key`
+        cutoff_sq = float("inf")
+        for enemy in game.objects_within(
+            position=unit.rect.center,
+            radius=AI.PRIORITY_TARGET_RANGE * AI._MAX_TARGET_PRIORITY,
+        ):
+            if enemy.team.faction is faction:
+                continue
+
+            enemy_x, enemy_y = enemy.rect.center
+            dx, dy = enemy_x - unit_x, enemy_y - unit_y
+            # Distance is at least the larger axis offset, so skip the full key
+            # calculation for enemies that can't beat the best so far at any priority.
+            min_dist = max(abs(dx), abs(dy))
+            if min_dist * min_dist > cutoff_sq:
+                continue
+
+            priority = enemy.TARGET_PRIORITY
+            if (
+                priority == 1
+                and enemy.IS_MOBILE
+                and enemy.health < 0.3 * enemy.max_health
+            ):
+                priority = AI._DAMAGED_UNIT_TARGET_PRIORITY
+            dist_sq = dx * dx + dy * dy
+            key = dist_sq / priority**2
+            if key < best_key:
+                best_target, best_dist_sq, best_key = enemy, dist_sq, key
+                cutoff_sq = key * max_priority_sq
 
-        targets.sort(key=lambda x: x[1] / x[2])
-        return targets[0][0] if targets and targets[0][1] < 250 else None
+        return best_target if best_dist_sq < AI.PRIORITY_TARGET_RANGE**2 else None
 
     def _find_valid_building_position(
         self,
@@ -182,237 +280,129 @@ class AI:
         friendly_buildings: Iterable[Building],
         iron_fields: Iterable[IronField],
     ) -> Coordinate:
+        hq_position = self.hq.position
         closest_field = min(
             iron_fields,
-            key=lambda f: self.hq.distance_to(f.position),
+            key=lambda f: hq_position.distance_squared_to(f.position),
             default=None,
         )
-        for building in friendly_buildings:
-            if building.health > 0:
-                for angle in range(0, 360, 20):
-                    pos = building.position + (
-                        math.cos(math.radians(angle)) * 120,
-                        math.sin(math.radians(angle)) * 120,
-                    )
-                    snapped_pos = geometry.snap_to_grid(pos)
-                    if game.is_valid_building_position(
-                        position=snapped_pos,
-                        new_building_class=building_cls,
-                        team=self.hq.team,
-                    ):
-                        if (
-                            closest_field
-                            and snapped_pos.distance_to(closest_field.position) < 600
-                        ):
-                            return snapped_pos
-
-                        if not closest_field:
-                            return snapped_pos
-
-        return geometry.snap_to_grid(self.hq.position)
+        field_position = closest_field.position if closest_field else None
+        candidates = (
+            geometry.snap_to_grid(building.position + offset)
+            for building in friendly_buildings
+            if building.health > 0
+            for offset in AI.PLACEMENT_OFFSETS
+        )
+        for pos in game.valid_building_positions(
+            positions=candidates, new_building_class=building_cls, team=self.hq.team
+        ):
+            if (
+                field_position is None
+                or pos.distance_squared_to(field_position) < 600**2
+            ):
+                return pos
+
+        return geometry.snap_to_grid(hq_position)
 
     def _buy_object(self, cls: type[GameObject]) -> None:
-        self.hq.production_queue.append(cls)
+        self.hq.enqueue(cls)
         previous_iron = self.team.iron
         self.team.iron -= cls.COST
         logger.debug(
-            f"AI bought {cls.__name__}; iron {previous_iron} -> {self.team.iron}"
+            "AI bought {}; iron {} -> {}", cls.__name__, previous_iron, self.team.iron
         )
 
     def _buy_objects(
         self,
         *,
-        friendly_units: Iterable[GameObject],
-        friendly_buildings: Iterable[Building],
         enemy_unit_counts: dict[str, int],
         iron_fields: Iterable[IronField],
         game: Game,
     ) -> None:
         current_units = {
-            "harvester": len([u for u in friendly_units if isinstance(u, Harvester)]),
-            "infantry": len([u for u in friendly_units if isinstance(u, Infantry)]),
-            "tank": len([u for u in friendly_units if isinstance(u, Tank)]),
-            "turret": len([b for b in friendly_buildings if isinstance(b, Turret)]),
-            "power_plant": len(
-                [b for b in friendly_buildings if isinstance(b, PowerPlant)]
-            ),
-            "barracks": len(
-                [
-                    b
-                    for b in friendly_buildings
-                    if isinstance(b, Barracks) and b.health > 0
-                ]
-            )
-            + len([b for b in self.hq.production_queue if b == Barracks]),
-            "war_factory": len(
-                [
-                    b
-                    for b in friendly_buildings
-                    if isinstance(b, WarFactory) and b.health > 0
-                ]
-            )
-            + len([b for b in self.hq.production_queue if b == WarFactory]),
+            "harvester": game.team_count(self.team, Harvester),
+            "infantry": game.team_count(self.team, Infantry),
+            "tank": game.team_count(self.team, Tank),
+            "turret": game.team_count(self.team, Turret),
+            "power_plant": game.team_count(self.team, PowerPlant),
+            "barracks": game.team_count(self.team, Barracks)
+            + self.hq.production_queue_counts[Barracks],
+            "war_factory": game.team_count(self.team, WarFactory)
+            + self.hq.production_queue_counts[WarFactory],
         }
-        desired_units = {
-            obj_cls: int(ratio * AI.SCALE_FACTOR)
-            for obj_cls, ratio in AI.DESIRED_UNIT_RATIO.items()
+        # Read once; only changes on buying, after which this returns
+        iron = self.team.iron
+        harvesters = current_units["harvester"]
+        desired_units = self._base_desired_units | {
+            "power_plant": max(1, (harvesters + 1) // 2),
+            "barracks": 1,
+            "war_factory": 1,
         }
-        desired_units["power_plant"] = max(1, (current_units["harvester"] + 1) // 2)
-        desired_units["barracks"] = 1
-        desired_units["war_factory"] = 1
         has_barracks = current_units["barracks"] > 0
         has_warfactory = current_units["war_factory"] > 0
         total_military = (
             current_units["infantry"] + current_units["tank"] + current_units["turret"]
         )
-        if not has_barracks and self.team.iron >= Barracks.COST:
+        if not has_barracks and iron >= Barracks.COST:
             self._buy_object(Barracks)
             return
 
-        if not has_warfactory and self.team.iron >= WarFactory.COST:
+        if not has_warfactory and iron >= WarFactory.COST:
             self._buy_object(WarFactory)
             return
 
         if (
             self.hq.has_enough_power
-            and self.team.iron >= PowerPlant.COST
+            and iron >= PowerPlant.COST
             and current_units["power_plant"] < desired_units["power_plant"]
         ):
             self._buy_object(PowerPlant)
             return
 
+        harvester_cap = min(
+            desired_units["harvester"], enemy_unit_counts["harvester"] + 1
+        )
         if (
-            (
-                current_units["harvester"]
-                < min(desired_units["harvester"], enemy_unit_counts["harvester"] + 1)
-                or self.iron_income_rate < 50
-            )
-            and self.team.iron >= Harvester.COST
+            (harvesters < harvester_cap or self.iron_income_rate < 50)
+            and iron >= Harvester.COST
             and has_warfactory
         ):
             self._buy_object(Harvester)
             return
 
-        if self.team.iron <= 0:
-            logger.debug(f"AI can't buy. Iron: ({self.team.iron})")
+        if iron <= 0:
+            logger.debug("AI can't buy. Iron: ({})", iron)
             return
 
-        production_options: list[type[GameObject]] = []
-        if self.state in ["BUILD UP", "AGGRESSIVE"]:
-            if (
-                total_military < 6
-                and has_barracks
-                and self.team.iron >= Infantry.COST
-                and current_units["infantry"] < desired_units["infantry"]
-            ):
-                production_options.append(Infantry)
-            if (
-                total_military < 6
-                and has_warfactory
-                and self.team.iron >= Tank.COST
-                and current_units["tank"] < desired_units["tank"]
-            ):
-                production_options.append(Tank)
-            if (
-                self.team.iron >= Turret.COST
-                and current_units["turret"] < desired_units["turret"]
-            ):
-                production_options.append(Turret)
-            if (
-                has_barracks
-                and self.team.iron >= Infantry.COST
-                and current_units["infantry"] < desired_units["infantry"]
-            ):
-                production_options.append(Infantry)
-            if (
-                has_warfactory
-                and self.team.iron >= Tank.COST
-                and current_units["tank"] < desired_units["tank"]
-            ):
-                production_options.append(Tank)
-            if (
-                current_units["harvester"] < desired_units["harvester"]
-                and self.team.iron >= Harvester.COST
-                and has_warfactory
-            ):
-                production_options.append(Harvester)
-            if (
-                current_units["power_plant"] < desired_units["power_plant"]
-                and self.team.iron >= PowerPlant.COST
-            ):
-                production_options.append(PowerPlant)
-            if (
-                current_units["barracks"] < 2
-                and self.team.iron >= Barracks.COST
-                and total_military >= 6
-            ):
-                production_options.append(Barracks)
-            if (
-                current_units["war_factory"] < 2
-                and self.team.iron >= WarFactory.COST
-                and total_military >= 6
-            ):
-                production_options.append(WarFactory)
-            if self.team.iron >= Headquarters.COST and current_units["harvester"] >= 2:
-                production_options.append(Headquarters)
-
-            if production_options:
-                self._buy_object(random.choice(production_options))
-
-        elif self.state in ["ATTACKED", "THREATENED"]:
-            if (
-                self.team.iron >= Turret.COST
-                and current_units["turret"] < desired_units["turret"]
-            ):
-                production_options.append(Turret)
-            if (
-                has_warfactory
-                and self.team.iron >= Tank.COST
-                and current_units["tank"] < desired_units["tank"]
-            ):
-                production_options.append(Tank)
-            if (
-                has_barracks
-                and self.team.iron >= Infantry.COST
-                and current_units["infantry"] < desired_units["infantry"]
-            ):
-                production_options.append(Infantry)
-            if (
-                current_units["harvester"]
-                < min(desired_units["harvester"], enemy_unit_counts["harvester"] + 1)
-                and self.team.iron >= Harvester.COST
-                and has_warfactory
-            ):
-                production_options.append(Harvester)
-
-            if (
-                current_units["power_plant"] < desired_units["power_plant"]
-                and self.team.iron >= PowerPlant.COST
-            ):
-                production_options.append(PowerPlant)
-
-            if production_options:
-                self._buy_object(random.choice(production_options))
+        context = _ProductionContext(
+            current=current_units,
+            desired=desired_units,
+            harvester_cap=harvester_cap,
+            total_military=total_military,
+            has_barracks=has_barracks,
+            has_warfactory=has_warfactory,
+        )
+        if rules := AI.PRODUCTION_RULES.get(self.state):
+            weights = [rule(context) if cls.COST <= iron else 0 for cls, rule in rules]
+            if any(weights):
+                cls, _ = random.choices(rules, weights)[0]
+                self._buy_object(cls)
 
-        elif (
+        if (
             self.state == "BROKE"
             and has_warfactory
-            and self.team.iron >= Harvester.COST
-            and current_units["harvester"]
-            < min(desired_units["harvester"], enemy_unit_counts["harvester"] + 1)
+            and iron >= Harvester.COST
+            and harvesters < harvester_cap
         ):
             self._buy_object(Harvester)
 
         if self.hq.production_queue and not self.hq.production_timer:
-            self.hq.production_timer = game.get_production_time(
-                cls=self.hq.production_queue[0],
-                team=self.team,
-            )
+            self.hq.start_production(game=game)
         if self.hq.pending_building and not self.hq.pending_building_pos:
             self.hq.pending_building_pos = self._find_valid_building_position(
                 building_cls=self.hq.pending_building,
                 game=game,
-                friendly_buildings=friendly_buildings,
+                friendly_buildings=game.team_buildings(self.team),
                 iron_fields=iron_fields,
             )
             self.hq.place_building(
@@ -424,24 +414,17 @@ class AI:
     def _coordinate_attack(
         self,
         *,
-        friendly_units: Iterable[GameObject],
-        enemy_units: Iterable[GameObject],
-        enemy_buildings: Iterable[Building],
+        game: Game,
         surprise: bool = False,
     ) -> None:
         self.wave_timer = 0
         self.wave_number += 1
-        wave_size = (
-            min(12 + self.wave_number, AI.MAX_WAVE_SIZE)
-            if surprise
-            else min(8 + self.wave_number * 2, AI.MAX_WAVE_SIZE)
-        )
-        self.wave_interval = random.randint(150, 250)
-        combat_units = [
-            u
-            for u in friendly_units
-            if isinstance(u, (Tank, Infantry)) and not u.target
-        ]
+        base_size, growth = (12, 1) if surprise else (8, 2)
+        wave_size = min(base_size + self.wave_number * growth, AI.MAX_WAVE_SIZE)
+        self.wave_interval = AI._random_wave_interval()
+        infantry = [u for u in game.team_objects(self.team, Infantry) if not u.target]
+        tanks = [u for u in game.team_objects(self.team, Tank) if not u.target]
+        combat_units: list[Infantry | Tank] = [*infantry, *tanks]
         if not combat_units:
             return
         tactics = (
@@ -453,51 +436,31 @@ class AI:
         )
         tactic = random.choice(tactics)
         if tactic == "balanced":
-            infantry_count = min(
-                int(wave_size * 0.6),
-                len([u for u in combat_units if isinstance(u, Infantry)]),
-            )
-            tank_count = min(
-                int(wave_size * 0.4),
-                len([u for u in combat_units if isinstance(u, Tank)]),
+            attack_units = (
+                infantry[: int(wave_size * 0.6)] + tanks[: int(wave_size * 0.4)]
             )
-            attack_units = [u for u in combat_units if isinstance(u, Infantry)][
-                :infantry_count
-            ] + [u for u in combat_units if isinstance(u, Tank)][:tank_count]
             if attack_units:
                 target = self._determine_priority_target(
                     unit=attack_units[0],
-                    enemy_units=enemy_units,
-                    enemy_buildings=enemy_buildings,
+                    game=game,
                 )
                 if target:
-                    for unit in attack_units:
-                        unit.target_object = target
-                        unit.target = target.position + (
-                            random.uniform(-20, 20),
-                            random.uniform(-20, 20),
-                        )
+                    AI._send_to_attack(attack_units, target=target)
 
         elif tactic == "flank":
             attack_units = combat_units[:wave_size]
-            gdi_hq = next(
-                (b for b in enemy_buildings if isinstance(b, Headquarters)),
-                None,
-            )
+            gdi_hq = self._enemy_hq(game=game)
             if gdi_hq:
+                hq_x, hq_y = gdi_hq.rect.center
                 group_size = len(attack_units) // 2
+                rand = random.random
                 for i, unit in enumerate(attack_units):
-                    offset_x = (
-                        random.uniform(80, 120)
-                        if i < group_size
-                        else random.uniform(-120, -80)
-                    )
-                    offset_y = (
-                        random.uniform(80, 120)
-                        if i < group_size
-                        else random.uniform(-120, -80)
+                    # First group flanks from below right, the rest from above left
+                    sign = 1 if i < group_size else -1
+                    unit.target = Coordinate(
+                        hq_x + sign * (80 + rand() * 40),
+                        hq_y + sign * (80 + rand() * 40),
                     )
-                    unit.target = gdi_hq.position + (offset_x, offset_y)
                     unit.target_object = gdi_hq
 
         elif tactic == "all_in":
@@ -505,54 +468,48 @@ class AI:
             if attack_units:
                 target = self._determine_priority_target(
                     unit=attack_units[0],
-                    enemy_units=enemy_units,
-                    enemy_buildings=enemy_buildings,
+                    game=game,
                 )
                 if target:
-                    for unit in attack_units:
-                        unit.target_object = target
-                        unit.target = target.position + (
-                            random.uniform(-20, 20),
-                            random.uniform(-20, 20),
-                        )
+                    AI._send_to_attack(attack_units, target=target)
 
         elif tactic == "defensive":
-            attack_units = combat_units[:wave_size]
-            for unit in attack_units:
-                unit.target = self.hq.position + (
-                    random.uniform(-50, 50),
-                    random.uniform(-50, 50),
+            hq_x, hq_y = self.hq.rect.center
+            rand = random.random
+            for unit in combat_units[:wave_size]:
+                unit.target = Coordinate(
+                    hq_x + rand() * 100 - 50, hq_y + rand() * 100 - 50
                 )
                 unit.target_object = None
 
-    def update(self, *, game: Game, iron_fields: Iterable[IronField]) -> None:
-        _friendly_units = game.team_units(self.team)
-        _friendly_buildings = game.team_buildings(self.team)
-        _enemy_units = game.team_units(self.opposing_team)
-        _enemy_buildings = game.team_buildings(self.opposing_team)
-        enemy_unit_counts = self._enemy_unit_counts(
-            enemy_units=_enemy_units, enemy_buildings=_enemy_buildings
-        )
+    @staticmethod
+    def _send_to_attack(
+        units: Iterable[Infantry | Tank], *, target: GameObject
+    ) -> None:
+        """Target `units` on `target`, scattered up to 20 px around it on each axis."""
+        target_x, target_y = target.rect.center
+        rand = random.random
+        for unit in units:
+            unit.target_object = target
+            unit.target = Coordinate(
+                target_x + rand() * 40 - 20, target_y + rand() * 40 - 20
+            )
+
+    def update(self, *, game: Game) -> None:
+        enemy_unit_counts = self._enemy_unit_counts(game=game)
         self.timer += 1
         self.wave_timer += 1
         self.surprise_attack_cooldown = max(0, self.surprise_attack_cooldown - 1)
-        self._determine_state(
-            friendly_units=_friendly_units,
-            enemy_units=_enemy_units,
-            enemy_buildings_count=len(_enemy_buildings),
-        )
+        self._determine_state(game=game)
         self._update_scouting(
-            friendly_units=_friendly_units,
-            enemy_buildings=_enemy_buildings,
-            iron_fields=iron_fields,
+            game=game,
+            iron_fields=game.iron_fields,
         )
         if self.timer >= self.ACTION_INTERVAL:
             self.timer = 0
             self._buy_objects(
-                friendly_units=_friendly_units,
-                friendly_buildings=_friendly_buildings,
                 enemy_unit_counts=enemy_unit_counts,
-                iron_fields=iron_fields,
+                iron_fields=game.iron_fields,
                 game=game,
             )
         if (
@@ -564,16 +521,12 @@ class AI:
             and random.random() < 0.1
         ):
             self._coordinate_attack(
-                friendly_units=_friendly_units,
-                enemy_units=_enemy_units,
-                enemy_buildings=_enemy_buildings,
+                game=game,
                 surprise=True,
             )
             self.surprise_attack_cooldown = 300
 
         elif self.wave_timer >= self.wave_interval:
             self._coordinate_attack(
-                friendly_units=_friendly_units,
-                enemy_units=_enemy_units,
-                enemy_buildings=_enemy_buildings,
+                game=game,
             )
@@ -39,7 +39,7 @@ class Camera:
             return
 
         if selected_units:
-            units_center = geometry.mean_vector([u.position for u in selected_units])
+            units_center = geometry.mean_vector(u.rect.center for u in selected_units)
             x = max(
                 self.viewport.width // 2,
                 min(MAP_WIDTH - self.viewport.width // 2, round(units_center.x)),
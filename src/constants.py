@@ -10,6 +10,8 @@ MAP_WIDTH, MAP_HEIGHT = 1600, 800
 TILE_SIZE = 32
 BUILDING_CONSTRUCTION_RANGE = 160
 BASE_PRODUCTION_TIME = 180
+FRAME_RATE = 60
+"""Target frames per second. Game timers count frames, so this also sets game speed."""
 
 GDI_COLOR = pg.Color(200, 150, 0)
 NOD_COLOR = pg.Color(200, 0, 0)
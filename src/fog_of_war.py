@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, TypeVar
 
 import pygame as pg
 
@@ -15,6 +16,37 @@ if TYPE_CHECKING:
     from src.camera import Camera
     from src.game_objects.buildings.building import Building
     from src.game_objects.game_object import GameObject
+    from src.projectile import Projectile
+    from src.team import Team
+
+_DrawableT = TypeVar("_DrawableT", bound="GameObject | Projectile")
+
+_TILE_COLUMNS = MAP_WIDTH // TILE_SIZE
+_TILE_ROWS = MAP_HEIGHT // TILE_SIZE
+
+
+@cache
+def _circle_stamp(
+    *, radius: int, offset_x: int, offset_y: int
+) -> tuple[tuple[int, int], ...]:
+    """Return offsets, relative to the tile containing a point, of tiles whose
+    centers are within `radius` of the point.
+
+    Args:
+        radius:
+        offset_x, offset_y:
+            Position of the point within its tile.
+    """
+    radius_tiles = radius // TILE_SIZE
+    tile_offsets = range(-radius_tiles, radius_tiles + 1)
+    return tuple(
+        (dx, dy)
+        for dy in tile_offsets
+        for dx in tile_offsets
+        if (offset_x - (dx * TILE_SIZE + TILE_SIZE // 2)) ** 2
+        + (offset_y - (dy * TILE_SIZE + TILE_SIZE // 2)) ** 2
+        <= radius**2
+    )
 
 
 @dataclass(kw_only=True)
@@ -22,14 +54,18 @@ class FogOfWar:
     explored: list[list[bool]] = dataclass_field(init=False, default_factory=list)
     visible: list[list[bool]] = dataclass_field(init=False, default_factory=list)
     surface: pg.Surface = dataclass_field(init=False)
+    _visible_tiles: set[tuple[int, int]] = dataclass_field(
+        init=False, default_factory=set
+    )
+    """Tiles currently visible, i.e. set in `visible`."""
+    _dirty_tiles: set[tuple[int, int]] = dataclass_field(
+        init=False, default_factory=set
+    )
+    """Tiles whose visibility has changed since they were last drawn to `surface`."""
 
     def __post_init__(self) -> None:
-        self.explored = [
-            [False] * (MAP_HEIGHT // TILE_SIZE) for _ in range(MAP_WIDTH // TILE_SIZE)
-        ]
-        self.visible = [
-            [False] * (MAP_HEIGHT // TILE_SIZE) for _ in range(MAP_WIDTH // TILE_SIZE)
-        ]
+        self.explored = [[False] * _TILE_ROWS for _ in range(_TILE_COLUMNS)]
+        self.visible = [[False] * _TILE_ROWS for _ in range(_TILE_COLUMNS)]
         self.surface = pg.Surface((MAP_WIDTH, MAP_HEIGHT), pg.SRCALPHA)
         self.surface.fill((0, 0, 0, 255))
 
@@ -39,47 +75,79 @@ class FogOfWar:
         pos = Coordinate(position)
         return int(pos.x // TILE_SIZE), int(pos.y // TILE_SIZE)
 
-    def _reveal(self, center: pg.typing.Point, radius: float) -> None:
+    def _reveal(self, center: pg.typing.Point, radius: int) -> None:
         """Set tiles within `radius` of `center` as explored and visible."""
-        center_pos = Coordinate(center)
-        tile_x, tile_y = self._tile(center_pos)
-        radius_tiles = int(radius // TILE_SIZE)
-        for y in range(
-            max(0, tile_y - radius_tiles),
-            min(len(self.explored[0]), tile_y + radius_tiles + 1),
+        tile_x, offset_x = divmod(int(center[0]), TILE_SIZE)
+        tile_y, offset_y = divmod(int(center[1]), TILE_SIZE)
+        explored, visible = self.explored, self.visible
+        visible_tiles = self._visible_tiles
+        for dx, dy in _circle_stamp(
+            radius=radius, offset_x=offset_x, offset_y=offset_y
         ):
-            for x in range(
-                max(0, tile_x - radius_tiles),
-                min(len(self.explored), tile_x + radius_tiles + 1),
-            ):
-                if (
-                    (center_pos.x - (x * TILE_SIZE + TILE_SIZE // 2)) ** 2
-                    + (center_pos.y - (y * TILE_SIZE + TILE_SIZE // 2)) ** 2
-                ) <= radius**2:
-                    self.explored[x][y] = True
-                    self.visible[x][y] = True
+            x, y = tile_x + dx, tile_y + dy
+            if 0 <= x < _TILE_COLUMNS and 0 <= y < _TILE_ROWS:
+                explored[x][y] = visible[x][y] = True
+                visible_tiles.add((x, y))
 
     def update(
         self, *, units: Iterable[GameObject], buildings: Iterable[Building]
     ) -> None:
         """Update fog of war around `units` and `buildings`."""
-        self.visible = [
-            [False] * len(self.explored[0]) for _ in range(len(self.explored))
-        ]  # Reset visible, but keep explored
+        # Reset visible, but keep explored
+        previous_visible_tiles = self._visible_tiles
+        for x, y in previous_visible_tiles:
+            self.visible[x][y] = False
+
+        self._visible_tiles = set()
         for unit in units:
-            self._reveal(center=unit.position, radius=150)
+            self._reveal(center=unit.rect.center, radius=150)
 
         for building in buildings:
-            self._reveal(center=building.position, radius=200)
+            self._reveal(center=building.rect.center, radius=200)
+
+        # Tiles only change appearance on becoming visible (which includes becoming
+        # explored) or ceasing to be visible
+        self._dirty_tiles |= previous_visible_tiles ^ self._visible_tiles
 
     def is_visible(self, position: pg.typing.Point) -> bool:
-        """Return whether `position` is in a visible tile."""
-        tile_x, tile_y = self._tile(position)
-        if 0 <= tile_x < len(self.visible) and 0 <= tile_y < len(self.visible[0]):
+        """Return whether `position` is in a visible tile.
+
+        Called per drawn entity, so indexes the grid directly rather than via
+        `_tile()`.
+        """
+        tile_x = int(position[0] // TILE_SIZE)
+        tile_y = int(position[1] // TILE_SIZE)
+        if 0 <= tile_x < _TILE_COLUMNS and 0 <= tile_y < _TILE_ROWS:
             return self.visible[tile_x][tile_y]
 
         return False
 
+    def visible_objects(
+        self, objects: Iterable[_DrawableT], *, team: Team
+    ) -> list[_DrawableT]:
+        """Return those of `objects` that belong to `team`, or are centered in a
+        visible tile, in order.
+
+        Checks a whole batch per call, indexing the grid inline, rather than calling
+        `is_visible()` per object.
+        """
+        visible, faction = self.visible, team.faction
+        result = []
+        for o in objects:
+            if o.team.faction is not faction:
+                center_x, center_y = o.rect.center
+                tile_x, tile_y = center_x // TILE_SIZE, center_y // TILE_SIZE
+                if not (
+                    0 <= tile_x < _TILE_COLUMNS
+                    and 0 <= tile_y < _TILE_ROWS
+                    and visible[tile_x][tile_y]
+                ):
+                    continue
+
+            result.append(o)
+
+        return result
+
     def is_explored(self, position: pg.typing.Point) -> bool:
         """Return whether `position` is in an explored tile."""
         tile_x, tile_y = self._tile(position)
@@ -93,15 +161,14 @@ class FogOfWar:
         fog tiles to `surface`.
 
         NB: drawn over buildings; under units.
+        Only tiles changed since the last call are redrawn to the fog surface.
         """
-        for y in range(len(self.explored[0])):
-            for x in range(len(self.explored)):
-                if self.explored[x][y]:
-                    alpha = 0 if self.visible[x][y] else 100
-                    pg.draw.rect(
-                        self.surface,
-                        (0, 0, 0, alpha),
-                        (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                    )
-
+        for x, y in self._dirty_tiles:
+            alpha = 0 if self.visible[x][y] else 100
+            self.surface.fill(
+                (0, 0, 0, alpha),
+                (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+            )
+
+        self._dirty_tiles.clear()
         surface.blit(source=self.surface, dest=camera.map_offset)
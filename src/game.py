@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import math
-import random
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import pygame as pg
 
@@ -22,217 +21,377 @@ from src.game_objects.units.harvester import Harvester
 from src.game_objects.units.infantry import Infantry
 from src.game_objects.units.tank import Tank
 from src.geometry import Coordinate
-from src.particle import Particle
 from src.projectile import Projectile
+from src.spatial_hash import SpatialHash
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     from src.game_objects.game_object import GameObject
     from src.iron_field import IronField
-    from src.team import Team
+    from src.particle import ParticlePool
+    from src.team import Faction, Team
+
+_GameObjectT = TypeVar("_GameObjectT", bound="GameObject")
+
+_PRODUCER_CLASSES: dict[type[GameObject], type[Building]] = {
+    Infantry: Barracks,
+    Tank: WarFactory,
+    Harvester: WarFactory,
+}
+"""Building classes that each speed up production of a unit class."""
+
+_UNIT_CLASSES: tuple[type[GameObject], ...] = (Harvester, Infantry, Tank)
+"""Concrete classes of `UnitType`, for subclass checks against registry keys."""
+
+
+@cache
+def _production_time(*, producer_count: int) -> float:
+    """Return production time (frames) given `producer_count` relevant buildings."""
+    return BASE_PRODUCTION_TIME * (0.9**producer_count)
 
 
 @dataclass(kw_only=True)
 class Game:
     """Holds game-scoped information (i.e. state) and methods."""
 
-    objects: set[GameObject] = dataclass_field(init=False, default_factory=set)
-    """All `GameObject`s. Not other sprites at present."""
     selected_units: set[UnitType] = dataclass_field(init=False, default_factory=set)
     """The currently selected player units."""
     selected_building: Building | None = dataclass_field(init=False, default=None)
     """The currently selected player building.
     NB: only one building can be selected at a time."""
     iron_fields: set[IronField] = dataclass_field(init=False, default_factory=set)
+    frame_count: int = dataclass_field(init=False, default=0)
+    """Frames elapsed since the game started. Advanced by the main loop."""
+    spatial_index: SpatialHash[GameObject] = dataclass_field(
+        init=False, default_factory=SpatialHash
+    )
+    """Live `GameObject`s by location. Refresh after movement."""
+    _registry: dict[Faction, dict[type[GameObject], pg.sprite.Group[GameObject]]] = (
+        dataclass_field(init=False, default_factory=dict)
+    )
+    """Live `GameObject`s by team faction, then by class, so per-team and per-class
+    queries don't scan everything. Killed objects leave their group automatically."""
 
     @property
-    def buildings(self) -> set[Building]:
+    def buildings(self) -> list[Building]:
         """Return all `Building`s."""
-        return {o for o in self.objects if isinstance(o, Building) and o.health > 0}
+        return cast("list[Building]", self._live_in(self._groups(Building)))
 
     @property
-    def units(self) -> set[UnitType]:
+    def units(self) -> list[UnitType]:
         """Return all `Unit`s."""
-        return {o for o in self.objects if isinstance(o, UnitType) and o.health > 0}
+        return cast("list[UnitType]", self._live_in(self._groups(_UNIT_CLASSES)))
+
+    def _groups(
+        self, cls: type[GameObject] | tuple[type[GameObject], ...]
+    ) -> Iterator[pg.sprite.Group[GameObject]]:
+        """Yield registry groups of all teams whose class is a subclass of `cls`."""
+        for groups_by_cls in self._registry.values():
+            for obj_cls, group in groups_by_cls.items():
+                if issubclass(obj_cls, cls):
+                    yield group
+
+    @staticmethod
+    def _live_in(groups: Iterable[pg.sprite.Group[GameObject]]) -> list[GameObject]:
+        """Return members of `groups` that have health left.
+
+        Killed objects have already left their groups; this also excludes those
+        destroyed this frame but not yet killed."""
+        return [o for group in groups for o in group.spritedict if o.health > 0]
+
+    def add_object(self, obj: GameObject) -> None:
+        """Add `obj` to the game."""
+        self.spatial_index.add(obj)
+        self._registry.setdefault(obj.team.faction, {}).setdefault(
+            type(obj), pg.sprite.Group()
+        ).add(obj)
+
+    def objects_in_rect(self, rect: pg.Rect) -> list[GameObject]:
+        """Return live `GameObject`s colliding with `rect`."""
+        return [o for o in self.spatial_index.query_rect(rect) if o.health > 0]
+
+    def objects_at(self, position: pg.typing.Point) -> list[GameObject]:
+        """Return live `GameObject`s whose rects contain `position`."""
+        x, y = int(position[0]), int(position[1])
+        return [
+            o
+            for o in self.objects_in_rect(pg.Rect(x, y, 1, 1))
+            if o.rect.collidepoint(x, y)
+        ]
+
+    def objects_within(
+        self, *, position: pg.typing.Point, radius: float
+    ) -> list[GameObject]:
+        """Return live `GameObject`s centered within `radius` of `position`."""
+        pos = Coordinate(position)
+        search_rect = pg.Rect(0, 0, 2 * radius, 2 * radius)
+        search_rect.center = round(pos.x), round(pos.y)
+        radius_sq = radius**2
+        return [
+            o
+            for o in self.objects_in_rect(search_rect)
+            if pos.distance_squared_to(o.rect.center) < radius_sq
+        ]
 
-    def team_buildings(self, team: Team) -> set[Building]:
+    def enemy_units_within(
+        self, *, team: Team, position: pg.typing.Point, radius: float
+    ) -> list[UnitType]:
+        """Return live `Unit`s not belonging to `team`, centered within `radius` of
+        `position`."""
+        faction = team.faction
+        return [
+            o
+            for o in self.objects_within(position=position, radius=radius)
+            if isinstance(o, UnitType) and o.team.faction is not faction
+        ]
+
+    def team_buildings(self, team: Team) -> list[Building]:
         """Return `Building`s belonging to `team`."""
-        return {b for b in self.buildings if b.team == team}
+        return cast("list[Building]", self._live_in(self._team_groups(team, Building)))
 
-    def team_units(self, team: Team) -> set[UnitType]:
+    def team_units(self, team: Team) -> list[UnitType]:
         """Return `Unit`s belonging to `team`."""
-        return {u for u in self.units if u.team == team}
+        return cast(
+            "list[UnitType]", self._live_in(self._team_groups(team, _UNIT_CLASSES))
+        )
+
+    def _team_groups(
+        self, team: Team, cls: type[GameObject] | tuple[type[GameObject], ...]
+    ) -> Iterator[pg.sprite.Group[GameObject]]:
+        for obj_cls, group in self._registry.get(team.faction, {}).items():
+            if issubclass(obj_cls, cls):
+                yield group
+
+    def team_objects(self, team: Team, cls: type[_GameObjectT]) -> list[_GameObjectT]:
+        """Return live instances of `cls` belonging to `team`."""
+        objects = [
+            o
+            for group in self._team_groups(team, cls)
+            for o in group.spritedict
+            if o.health > 0
+        ]
+        return cast("list[_GameObjectT]", objects)
+
+    def team_count(self, team: Team, cls: type[GameObject]) -> int:
+        """Return the number of instances of `cls` belonging to `team`.
+
+        Counts group sizes without checking `health`, unlike `team_objects()`. This
+        relies on every damage path calling `kill()` as soon as `health` reaches
+        zero, so groups never hold dead objects between those calls.
+        """
+        return sum(len(group) for group in self._team_groups(team, cls))
+
+    def team_power_usage(self, team: Team) -> int:
+        """Return total `POWER_USAGE` of all objects belonging to `team`.
+
+        `POWER_USAGE` is a class constant, so this is summed per registry group
+        rather than per object. Like `team_count()`, relies on dead objects having
+        been killed.
+        """
+        return sum(
+            obj_cls.POWER_USAGE * len(group)
+            for obj_cls, group in self._registry.get(team.faction, {}).items()
+        )
 
     def get_production_time(self, *, cls: type[GameObject], team: Team) -> float:
         """Return time (frames) required to produce a new `Game`Object` of type `cls`."""
-        _friendly_buildings = self.team_buildings(team)
-        if cls == Infantry:
-            barracks_count = len(
-                [b for b in _friendly_buildings if isinstance(b, Barracks)]
-            )
-            return BASE_PRODUCTION_TIME * (0.9**barracks_count)
+        producer_cls = _PRODUCER_CLASSES.get(cls)
+        if producer_cls is None:
+            return BASE_PRODUCTION_TIME
 
-        if cls in [Tank, Harvester]:
-            warfactory_count = len(
-                [b for b in _friendly_buildings if isinstance(b, WarFactory)]
-            )
-            return BASE_PRODUCTION_TIME * (0.9**warfactory_count)
-
-        return BASE_PRODUCTION_TIME
+        return _production_time(producer_count=self.team_count(team, producer_cls))
 
     def handle_collisions(self) -> None:
-        """Check for collisions between all `Unit`s and move them accordingly."""
-        for unit in self.units:
-            for other in self.units:
-                if unit != other and unit.rect.colliderect(other.rect):
-                    dist = unit.distance_to(other.position)
-                    if dist > 0:
-                        push = (
-                            0.3
-                            if isinstance(unit, Harvester)
-                            and isinstance(other, Harvester)
-                            else 0.5
-                        )
-                        d = unit.displacement_to(other.position)
-                        unit.rect.x += push * d.x / dist
-                        other.rect.y -= push * d.y / dist
+        """Check for collisions between all `Unit`s and move them accordingly.
+
+        Only pairs sharing a `spatial_index` cell are tested, so the index must be
+        up to date. Each colliding pair is found once, and pushed from both sides.
+        """
+        query_rect = self.spatial_index.query_rect
+        # Orders units, so each pair is handled only from its lower-ordered side.
+        # Also excludes non-units and dead units from candidates.
+        order: dict[GameObject, int] = {unit: i for i, unit in enumerate(self.units)}
+        for unit, i in order.items():
+            unit_rect = unit.rect
+            unit_is_harvester = isinstance(unit, Harvester)
+            for other in query_rect(unit_rect):
+                j = order.get(other)
+                if j is not None and j > i:
+                    push = (
+                        0.3
+                        if unit_is_harvester and isinstance(other, Harvester)
+                        else 0.5
+                    )
+                    other_rect = other.rect
+                    Game._push_apart(unit_rect, other_rect, push=push)
+                    Game._push_apart(other_rect, unit_rect, push=push)
+
+    @staticmethod
+    def _push_apart(rect: pg.Rect, other_rect: pg.Rect, *, push: float) -> None:
+        """Move `rect` horizontally and `other_rect` vertically, by `push` of the
+        normalized displacement between their centers."""
+        dx = other_rect.centerx - rect.centerx
+        dy = other_rect.centery - rect.centery
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > 0:
+            push_per_px = push * dist_sq**-0.5
+            rect.x += dx * push_per_px
+            other_rect.y -= dy * push_per_px
 
     def handle_attacks(
         self,
         *,
-        team: Team,
-        opposing_team: Team,
         projectiles: pg.sprite.Group[Any],
-        particles: pg.sprite.Group[Any],
+        particles: ParticlePool,
     ) -> None:
-        """Handle all attacks by `team` on `opposing_team`."""
-        for unit in self.team_units(team):
-            if isinstance(unit, (Tank, Infantry)) and unit.cooldown_timer == 0:
-                closest_target, min_dist = None, float("inf")
-                if unit.target_object and unit.target_object.health > 0:
-                    dist = unit.distance_to(unit.target_object.position)
-                    if dist <= unit.ATTACK_RANGE:
-                        closest_target, min_dist = unit.target_object, dist
-
-                if not closest_target:
-                    for obj in (
-                        *self.team_units(opposing_team),
-                        *self.team_buildings(opposing_team),
-                    ):
-                        dist = unit.distance_to(obj.position)
-                        if dist <= unit.ATTACK_RANGE and dist < min_dist:
-                            closest_target, min_dist = obj, dist
-
-                if closest_target:
-                    unit.target_object = closest_target
-                    unit.target = closest_target.position
-                    if isinstance(unit, Tank):
-                        d = unit.displacement_to(closest_target.position)
-                        unit.angle = math.degrees(
-                            math.atan2(d.y, d.x)
-                        )  # Updated to match Tank's angle calculation
-                        projectiles.add(
-                            Projectile(
-                                unit.position,
-                                closest_target,
-                                unit.attack_damage,
-                                unit.team,
-                            )
-                        )
-                        unit.recoil = 5
-                        barrel_angle = math.radians(unit.angle)
-                        smoke_x = unit.position.x + math.cos(barrel_angle) * (
-                            unit.rect.width // 2 + 12
-                        )
-                        smoke_y = unit.position.y + math.sin(barrel_angle) * (
-                            unit.rect.width // 2 + 12
+        """Handle all attacks by all teams, in a single pass over all attacking
+        `Unit`s.
+
+        Enemies in range are found via `spatial_index`, so it must be up to date.
+        """
+        nearest = self.spatial_index.nearest
+        # Selected by registry group class, not per unit. Most are usually cooling
+        # down, so that is checked first.
+        ready_attackers = cast(
+            "list[Infantry | Tank]",
+            [
+                o
+                for group in self._groups((Infantry, Tank))
+                for o in group.spritedict
+                if o.cooldown_timer == 0 and o.health > 0
+            ],
+        )
+        for unit in ready_attackers:
+            closest_target = None
+            attack_range = unit.ATTACK_RANGE
+            if (
+                unit.target_object
+                and unit.target_object.health > 0
+                and unit.distance_squared_to(unit.target_object.position)
+                <= attack_range**2
+            ):
+                closest_target = unit.target_object
+
+            if not closest_target:
+                faction = unit.team.faction
+                closest_target = nearest(
+                    unit.rect.center,
+                    max_distance=attack_range,
+                    # Health check as may have been killed earlier this pass
+                    predicate=lambda o: o.team.faction is not faction and o.health > 0,
+                )
+
+            if closest_target:
+                unit.target_object = closest_target
+                unit.target = closest_target.position
+                if isinstance(unit, Tank):
+                    d = unit.displacement_to(closest_target.position)
+                    dist, unit.angle = d.as_polar()
+                    projectiles.add(
+                        Projectile(
+                            unit.position,
+                            closest_target,
+                            unit.attack_damage,
+                            unit.team,
                         )
-                        for _ in range(5):
-                            particles.add(
-                                Particle(
-                                    (smoke_x, smoke_y),
-                                    random.uniform(-1.5, 1.5),
-                                    random.uniform(-1.5, 1.5),
-                                    random.randint(6, 10),
-                                    pg.Color(100, 100, 100),
-                                    20,
-                                )
-                            )
-                    else:
-                        closest_target.health -= unit.attack_damage
-                        closest_target.under_attack = True
-                        for _ in range(3):
-                            particles.add(
-                                Particle(
-                                    unit.position,
-                                    random.uniform(-1, 1),
-                                    random.uniform(-1, 1),
-                                    4,
-                                    pg.Color(255, 200, 100),
-                                    10,
-                                )
-                            )
-                        if closest_target.health <= 0:
-                            closest_target.kill()
-                            unit.target = unit.target_object = None
-
-                    unit.cooldown_timer = unit.ATTACK_COOLDOWN_PERIOD
+                    )
+                    unit.recoil = 5
+                    barrel_length = unit.rect.width // 2 + 12
+                    barrel = (
+                        d * (barrel_length / dist)
+                        if dist
+                        else Coordinate(barrel_length, 0)
+                    )
+                    particles.spawn_burst(
+                        unit.position + barrel,
+                        count=5,
+                        speed=1.5,
+                        size=(6, 10),
+                        color=pg.Color(100, 100, 100),
+                        lifetime=20,
+                    )
+                else:
+                    closest_target.health -= unit.attack_damage
+                    closest_target.under_attack = True
+                    particles.spawn_burst(
+                        unit.position,
+                        count=3,
+                        speed=1,
+                        size=4,
+                        color=pg.Color(255, 200, 100),
+                        lifetime=10,
+                    )
+                    if closest_target.health <= 0:
+                        closest_target.kill()
+                        unit.target = unit.target_object = None
+
+                unit.cooldown_timer = unit.ATTACK_COOLDOWN_PERIOD
 
     def handle_projectiles(
         self,
         projectiles: Iterable[Projectile],
-        particles: pg.sprite.Group[Any],
+        particles: ParticlePool,
     ) -> None:
-        """Handle all projectiles."""
+        """Handle all projectiles.
+
+        Objects hit are found via `spatial_index`, so it must be up to date.
+        """
+        query_rect = self.spatial_index.query_rect
         for projectile in projectiles:
             # Check collision with all enemy units and buildings, not just the target
-            enemy_units = [u for u in self.units if u.team != projectile.team]
-            enemy_buildings = [b for b in self.buildings if b.team != projectile.team]
-            for e in enemy_units + enemy_buildings:
-                if projectile.rect.colliderect(e.rect):
-                    e.health -= projectile.damage
-                    e.under_attack = True  # Set under_attack when damage is applied
-                    for _ in range(5):
-                        particles.add(
-                            Particle(
-                                projectile.position,
-                                random.uniform(-2, 2),
-                                random.uniform(-2, 2),
-                                6,
-                                pg.Color(255, 200, 100),
-                                15,
-                            )
-                        )
-                    projectile.kill()
-                    if e.health <= 0:
-                        e.kill()
-
-                    break
+            faction = projectile.team.faction
+            hits = [
+                o
+                for o in query_rect(projectile.rect)
+                if o.team.faction is not faction and o.health > 0
+            ]
+            if not hits:
+                continue
 
-    @staticmethod
-    def _rect_is_within_map(rect: pg.typing.RectLike) -> bool:
-        """Return whether `rect` is within the map."""
-        map_rect = pg.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT)
-        return map_rect.contains(rect)
-
-    def _is_near_friendly_building(
-        self, *, position: pg.typing.Point, team: Team
-    ) -> bool:
-        """Return whether `position` is within construction range of `team`'s buildings."""
-        pos = Coordinate(position)
-        return any(
-            pos.distance_to(building.position) < BUILDING_CONSTRUCTION_RANGE
-            for building in self.team_buildings(team)
-        )
+            # Units take the hit in preference to buildings
+            e = next((o for o in hits if not isinstance(o, Building)), hits[0])
+            e.health -= projectile.damage
+            e.under_attack = True  # Set under_attack when damage is applied
+            particles.spawn_burst(
+                projectile.position,
+                count=5,
+                speed=2,
+                size=6,
+                color=pg.Color(255, 200, 100),
+                lifetime=15,
+            )
+            projectile.kill()
+            if e.health <= 0:
+                e.kill()
 
-    def _rect_collides_with_building(
+    def valid_building_positions(
         self,
         *,
-        rect: pg.Rect,
-    ) -> bool:
-        """Return whether `rect` collides with any building."""
-        return any(rect.colliderect(building.rect) for building in self.buildings)
+        positions: Iterable[pg.typing.Point],
+        new_building_class: type[Building],
+        team: Team,
+    ) -> Iterator[Coordinate]:
+        """Yield those of `positions` where `team` may place a `new_building_class`.
+
+        Existing buildings are gathered once, so checking many candidates here is
+        cheaper than calling `is_valid_building_position()` for each.
+        """
+        map_rect = pg.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT)
+        building_rects = [b.rect for b in self.buildings]
+        friendly_positions = [b.position for b in self.team_buildings(team)]
+        range_sq = BUILDING_CONSTRUCTION_RANGE**2
+        for position in positions:
+            pos = Coordinate(position)
+            footprint = pg.Rect(pos, new_building_class.SIZE)
+            if (
+                map_rect.contains(footprint)
+                and any(
+                    pos.distance_squared_to(p) < range_sq for p in friendly_positions
+                )
+                and footprint.collidelist(building_rects) == -1
+            ):
+                yield pos
 
     def is_valid_building_position(
         self,
@@ -241,17 +400,13 @@ class Game:
         new_building_class: type[Building],
         team: Team,
     ) -> bool:
-        new_building_footprint = pg.Rect(position, new_building_class.SIZE)
-        return all(
-            (
-                self._rect_is_within_map(new_building_footprint),
-                self._is_near_friendly_building(position=position, team=team),
-                not self._rect_collides_with_building(rect=new_building_footprint),
-            )
+        valid_positions = self.valid_building_positions(
+            positions=(position,), new_building_class=new_building_class, team=team
         )
+        return next(valid_positions, None) is not None
 
     def delete_selected_building(self) -> None:
         """Delete the currently selected building."""
         if self.selected_building:
-            self.objects.remove(self.selected_building)
+            self.selected_building.kill()
             self.selected_building = None
@@ -1,19 +1,40 @@
 from __future__ import annotations
 
-import random
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING
 
 import pygame as pg
 
-from src.constants import GDI_COLOR, VIEW_DEBUG_MODE_IS_ENABLED
+from src.constants import GDI_COLOR
 from src.game_objects.game_object import GameObject
-from src.particle import Particle
 
 if TYPE_CHECKING:
-    from src.camera import Camera
+    from src.particle import ParticlePool
     from src.team import Team
 
 
+@cache
+def _built_image(*, size: tuple[int, int], color: tuple[int, ...]) -> pg.Surface:
+    """Return image of a fully built building.
+
+    Shared between buildings, so copy before changing alpha.
+    """
+    image = pg.Surface(size, pg.SRCALPHA)
+    # Add details to building
+    pg.draw.rect(image, color, ((0, 0), size))  # Base
+    # Clamp color values to prevent negative values
+    inner_color = (
+        max(0, color[0] - 50),
+        max(0, color[1] - 50),
+        max(0, color[2] - 50),
+    )
+    pg.draw.rect(image, inner_color, ((5, 5), (size[0] - 10, size[1] - 10)))  # Inner
+    for i in range(10, size[0] - 10, 20):
+        pg.draw.rect(image, (200, 200, 200), (i, 10, 10, 10))  # Windows
+
+    return image
+
+
 class Building(GameObject):
     """Building base class. Stationary."""
 
@@ -30,63 +51,44 @@ class Building(GameObject):
         font: pg.Font,
     ) -> None:
         super().__init__(position=position, team=team)
-        self.image = pg.Surface(self.SIZE, pg.SRCALPHA)
+        self._built_image = _built_image(size=self.SIZE, color=tuple(color))
+        # Own copy while under construction, as its alpha changes
+        self.image = self._built_image.copy()
         self.rect = self.image.get_rect(topleft=position)
         self.font = font
         self.construction_progress = 0
         self.is_explored = False
         """Controls whether AI building is drawn."""
 
-        # Add details to building
-        pg.draw.rect(self.image, color, ((0, 0), self.SIZE))  # Base
-        # Clamp color values to prevent negative values
-        inner_color = (
-            max(0, color[0] - 50),
-            max(0, color[1] - 50),
-            max(0, color[2] - 50),
-        )
-        pg.draw.rect(
-            self.image, inner_color, ((5, 5), (self.SIZE[0] - 10, self.SIZE[1] - 10))
-        )  # Inner
-        for i in range(10, self.SIZE[0] - 10, 20):
-            pg.draw.rect(self.image, (200, 200, 200), (i, 10, 10, 10))  # Windows
-
-    def update(self, particles: pg.sprite.Group[Any], *args, **kwargs) -> None:
+    def update(self, particles: ParticlePool, *args, **kwargs) -> None:
         """Update the building, including removal at zero health."""
         if self.construction_progress < self.CONSTRUCTION_TIME:
             self.construction_progress += 1
-            self.image.set_alpha(
-                int(255 * self.construction_progress / self.CONSTRUCTION_TIME)
-            )
+            if self.construction_progress < self.CONSTRUCTION_TIME:
+                self.image.set_alpha(
+                    int(255 * self.construction_progress / self.CONSTRUCTION_TIME)
+                )
+            else:
+                self.image = self._built_image
         super().update(*args, **kwargs)
         if self.health <= 0:
-            for _ in range(15):
-                particles.add(
-                    Particle(
-                        self.position,
-                        random.uniform(-3, 3),
-                        random.uniform(-3, 3),
-                        random.randint(6, 12),
-                        pg.Color(200, 100, 100),
-                        30,
-                    )
-                )
+            particles.spawn_burst(
+                self.position,
+                count=15,
+                speed=3,
+                size=(6, 12),
+                color=pg.Color(200, 100, 100),
+                lifetime=30,
+            )
             self.kill()
 
-    def draw(self, *, surface: pg.Surface, camera: Camera) -> None:
-        """Draw the building, and label with first letter of class."""
-        surface.blit(source=self.image, dest=camera.to_screen(self.rect.topleft))
-        if self.is_selected:
-            self.draw_selection_indicator(surface=surface, camera=camera)
-
-        if VIEW_DEBUG_MODE_IS_ENABLED:
-            self.draw_debug_info(surface=surface, camera=camera)
-
+    def draw_overlays(self, *, surface: pg.Surface, screen_rect: pg.Rect) -> None:
+        """Draw overlays, and label with first letter of class."""
+        super().draw_overlays(surface=surface, screen_rect=screen_rect)
         _label = self.font.render(
             text=self.__class__.__name__[0],
             antialias=True,
             color=(255, 255, 255),
         )
-        _label_pos = camera.to_screen(self.rect.center) + (-6, 0)
+        _label_pos = screen_rect.centerx - 6, screen_rect.centery
         surface.blit(source=_label, dest=_label_pos)
-        self.draw_health_bar(surface=surface, camera=camera)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING
 
 from src import geometry
@@ -17,8 +18,6 @@ from src.game_objects.units.tank import Tank
 from src.team import Faction, Team
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-
     import pygame as pg
 
     from src.game import Game
@@ -31,6 +30,7 @@ class Headquarters(Building):
     # Override base class(es):
     COST = 2000
     SIZE = 80, 80
+    TARGET_PRIORITY = 2.5
     # Class-specific:
     BASE_POWER = 300
 
@@ -45,7 +45,13 @@ class Headquarters(Building):
         self.health = self.max_health
         self.iron: int = 1500
         self.production_queue: list[type[GameObject]] = []
+        self.production_queue_counts: Counter[type[GameObject]] = Counter()
+        """Number of each class in `production_queue`, kept up to date by `enqueue()`
+        and `update()`."""
         self.production_timer: float = 0
+        self.production_time: float = 0
+        """Total production time (frames) of the item at the front of the queue, as
+        of when its `production_timer` started."""
         self.pending_building: type[Building] | None = None
         self.pending_building_pos: pg.typing.Point | None = None
 
@@ -53,49 +59,40 @@ class Headquarters(Building):
         self.power_usage: int = 0
         self.power_output: int = 0
 
-    @classmethod
-    def _power_output(cls, *, friendly_buildings: Iterable[Building]) -> int:
-        return cls.BASE_POWER + sum(
-            b.POWER_OUTPUT
-            for b in friendly_buildings
-            if isinstance(b, PowerPlant) and b.health > 0
-        )
-
-    def _power_usage(
-        self,
-        *,
-        friendly_units: Iterable[GameObject],
-        friendly_buildings: Iterable[Building],
-    ) -> int:
-        return sum(u.POWER_USAGE for u in friendly_units) + sum(
-            b.POWER_USAGE for b in friendly_buildings if b != self
-        )
-
     @property
     def has_enough_power(self) -> bool:
         return self.power_output >= self.power_usage
 
+    def enqueue(self, cls: type[GameObject]) -> None:
+        """Add `cls` to the end of the production queue."""
+        self.production_queue.append(cls)
+        self.production_queue_counts[cls] += 1
+
+    def start_production(self, *, game: Game) -> None:
+        """Start `production_timer` for the item at the front of the queue."""
+        self.production_time = self.production_timer = game.get_production_time(
+            cls=self.production_queue[0], team=self.team
+        )
+
     def update(self, *args, game: Game, **kwargs) -> None:
         super().update(*args, **kwargs)
-        _friendly_buildings = game.team_buildings(self.team)
-        _friendly_units = game.team_units(self.team)
-        self.power_output = self._power_output(friendly_buildings=_friendly_buildings)
-        self.power_usage = self._power_usage(
-            friendly_units=_friendly_units, friendly_buildings=_friendly_buildings
+        self.power_output = Headquarters.BASE_POWER + (
+            PowerPlant.POWER_OUTPUT * game.team_count(self.team, PowerPlant)
         )
+        # Excluding this HQ's own usage:
+        self.power_usage = game.team_power_usage(self.team) - self.POWER_USAGE
         if (
             self.production_queue
             and not self.production_timer
             and self.has_enough_power
         ):
-            self.production_timer = game.get_production_time(
-                cls=self.production_queue[0], team=self.team
-            )
+            self.start_production(game=game)
 
         if self.production_queue:
             self.production_timer -= 1 if self.has_enough_power else 0.5
             if self.production_timer <= 0:
                 unit_cls = self.production_queue.pop(0)
+                self.production_queue_counts[unit_cls] -= 1
                 if issubclass(unit_cls, Building):
                     self.pending_building = unit_cls
                     self.pending_building_pos = None
@@ -103,26 +100,23 @@ class Headquarters(Building):
                 else:
                     spawn_building: Building = self
                     if unit_cls == Infantry:
-                        barracks = [
-                            b for b in _friendly_buildings if isinstance(b, Barracks)
-                        ]
+                        barracks = game.team_objects(self.team, Barracks)
                         if not barracks:
                             return
 
                         spawn_building = min(
                             barracks,
-                            key=lambda b: self.distance_to(b.position),
+                            key=lambda b: self.distance_squared_to(b.position),
                         )
 
                     elif unit_cls in [Tank, Harvester]:
-                        warfactories = [
-                            b for b in _friendly_buildings if isinstance(b, WarFactory)
-                        ]
+                        warfactories = game.team_objects(self.team, WarFactory)
                         if not warfactories:
                             return
 
                         spawn_building = min(
-                            warfactories, key=lambda b: self.distance_to(b.position)
+                            warfactories,
+                            key=lambda b: self.distance_squared_to(b.position),
                         )
                     spawn_pos = (
                         spawn_building.rect.right + 20,
@@ -147,16 +141,12 @@ class Headquarters(Building):
                     for unit, pos in zip(new_units, formation_positions):
                         unit.rect.center = pos
                         unit.formation_target = pos
-                        game.objects.add(unit)
+                        game.add_object(unit)
 
-                self.production_timer = (
-                    game.get_production_time(
-                        cls=self.production_queue[0],
-                        team=self.team,
-                    )
-                    if self.production_queue and self.has_enough_power
-                    else 0
-                )
+                if self.production_queue and self.has_enough_power:
+                    self.start_production(game=game)
+                else:
+                    self.production_timer = 0
 
     def place_building(
         self,
@@ -179,12 +169,10 @@ class Headquarters(Building):
         if game.is_valid_building_position(
             position=snapped_pos, new_building_class=unit_cls, team=self.team
         ):
-            game.objects.add(
+            game.add_object(
                 unit_cls(position=snapped_pos, team=self.team, font=self.font)
             )
             self.pending_building = None
             self.pending_building_pos = None
             if self.production_queue and self.has_enough_power:
-                self.production_timer = game.get_production_time(
-                    cls=self.production_queue[0], team=self.team
-                )
+                self.start_production(game=game)
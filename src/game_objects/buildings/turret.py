@@ -1,20 +1,32 @@
 from __future__ import annotations
 
-import math
-import random
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 import pygame as pg
 
 from src.game_objects.buildings.building import Building
-from src.particle import Particle
+from src.geometry import heading, snap_angle
 from src.projectile import Projectile
 from src.team import Faction, Team
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from src.game import Game
+    from src.particle import ParticlePool
 
-    from src.game_objects.game_object import GameObject
+
+@cache
+def _turret_image(*, faction: Faction, angle: float) -> pg.Surface:
+    """Return fully built turret image with barrel facing `angle` (degrees)."""
+    image = pg.Surface((50, 50), pg.SRCALPHA)
+    base = pg.Surface((40, 40), pg.SRCALPHA)
+    base.fill((180, 180, 0) if faction == Faction.GDI else (180, 0, 0))
+    barrel = pg.Surface((25, 6), pg.SRCALPHA)
+    pg.draw.line(barrel, (80, 80, 80), (0, 3), (18, 3), 4)
+    rotated_barrel = pg.transform.rotate(barrel, angle)
+    image.blit(source=base, dest=(5, 5))
+    image.blit(source=rotated_barrel, dest=rotated_barrel.get_rect(center=(25, 25)))
+    return image
 
 
 class Turret(Building):
@@ -25,6 +37,7 @@ class Turret(Building):
     COST = 600
     POWER_USAGE = 25
     SIZE = 50, 50
+    TARGET_PRIORITY = 2
 
     def __init__(self, *, position: pg.typing.Point, team: Team, font: pg.Font) -> None:
         super().__init__(
@@ -42,12 +55,15 @@ class Turret(Building):
         self.cooldown_timer = 0
         self.target_unit = None
         self.angle: float = 0
+        self._image_angle: float | None = None
+        """Snapped angle of the current shared `image`. None while under
+        construction, when `image` is a faded copy."""
 
     def update(
         self,
-        particles: pg.sprite.Group[Any],
+        particles: ParticlePool,
         projectiles: pg.sprite.Group[Any],
-        enemy_units: Iterable[GameObject],
+        game: Game,
         *args,
         **kwargs,
     ) -> None:
@@ -55,17 +71,19 @@ class Turret(Building):
         if self.cooldown_timer > 0:
             self.cooldown_timer -= 1
         if self.cooldown_timer == 0:
-            closest_target, min_dist = None, float("inf")
-            for u in enemy_units:
-                if u.health > 0:
-                    dist = self.distance_to(u.position)
-                    if dist < Turret.ATTACK_RANGE and dist < min_dist:
-                        closest_target, min_dist = u, dist
+            closest_target = self.nearest(
+                game.enemy_units_within(
+                    team=self.team,
+                    position=self.rect.center,
+                    radius=Turret.ATTACK_RANGE,
+                ),
+                max_range=Turret.ATTACK_RANGE,
+            )
 
             if closest_target:
                 self.target_object = closest_target
-                dx, dy = self.displacement_to(closest_target.position)
-                self.angle = math.degrees(math.atan2(-dy, dx))
+                # Negated, as y is down on screen but barrel rotation is CCW
+                self.angle = -heading(self.rect.center, closest_target.rect.center)
                 projectiles.add(
                     Projectile(
                         self.position,
@@ -75,30 +93,25 @@ class Turret(Building):
                     )
                 )
                 self.cooldown_timer = self.attack_cooldown
-                for _ in range(5):
-                    particles.add(
-                        Particle(
-                            self.position,
-                            random.uniform(-1.5, 1.5),
-                            random.uniform(-1.5, 1.5),
-                            random.randint(6, 10),
-                            pg.Color(100, 100, 100),
-                            20,
-                        )
-                    )
+                particles.spawn_burst(
+                    self.position,
+                    count=5,
+                    speed=1.5,
+                    size=(6, 10),
+                    color=pg.Color(100, 100, 100),
+                    lifetime=20,
+                )
             else:
                 self.target_unit = None
 
-        self.image = pg.Surface((50, 50), pg.SRCALPHA)
-        base = pg.Surface((40, 40), pg.SRCALPHA)
-        base.fill((180, 180, 0) if self.team.faction == Faction.GDI else (180, 0, 0))
-        barrel = pg.Surface((25, 6), pg.SRCALPHA)
-        pg.draw.line(barrel, (80, 80, 80), (0, 3), (18, 3), 4)
-        rotated_barrel = pg.transform.rotate(barrel, self.angle)
-        self.image.blit(source=base, dest=(5, 5))
-        self.image.blit(
-            source=rotated_barrel, dest=rotated_barrel.get_rect(center=(25, 25))
-        )
-        self.image.set_alpha(
-            int(255 * self.construction_progress / self.CONSTRUCTION_TIME)
-        )
+        angle = snap_angle(self.angle)
+        if self.construction_progress < self.CONSTRUCTION_TIME:
+            # Own copy of the shared image, as its alpha changes
+            self.image = _turret_image(faction=self.team.faction, angle=angle).copy()
+            self.image.set_alpha(
+                int(255 * self.construction_progress / self.CONSTRUCTION_TIME)
+            )
+        elif angle != self._image_angle:
+            # Once built, only changes when the barrel turns
+            self.image = _turret_image(faction=self.team.faction, angle=angle)
+            self._image_angle = angle
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 import pygame as pg
 
 from src import draw_utils
-from src.constants import MAP_HEIGHT, MAP_WIDTH, SELECTION_INDICATOR_COLOR
+from src.constants import (
+    MAP_HEIGHT,
+    MAP_WIDTH,
+    SELECTION_INDICATOR_COLOR,
+    VIEW_DEBUG_MODE_IS_ENABLED,
+)
 from src.geometry import Coordinate
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from src.camera import Camera
     from src.team import Team
 
+_GameObjectT = TypeVar("_GameObjectT", bound="GameObject")
+
 
 class GameObject(pg.sprite.Sprite):
     """Base class for all buildings and units."""
@@ -22,6 +31,8 @@ class GameObject(pg.sprite.Sprite):
     IS_MOBILE = False
     """Override for mobile classes."""
     POWER_USAGE = 0
+    TARGET_PRIORITY: float = 1
+    """Weight of the object as an AI attack target. Higher is preferred."""
 
     def __init__(self, *, position: pg.typing.Point, team: Team) -> None:
         super().__init__()
@@ -50,6 +61,27 @@ class GameObject(pg.sprite.Sprite):
         """Return the distance to `position`."""
         return (position - self.position).magnitude()
 
+    def distance_squared_to(self, position: pg.typing.Point) -> float:
+        """Return the squared distance to `position`.
+        Cheaper than `distance_to()` where only a comparison is needed."""
+        return self.position.distance_squared_to(position)
+
+    def nearest(
+        self, objects: Iterable[_GameObjectT], *, max_range: float
+    ) -> _GameObjectT | None:
+        """Return the nearest live object in `objects` that is closer than
+        `max_range`, or None."""
+        x, y = self.rect.center
+        nearest, min_dist_sq = None, max_range**2
+        for obj in objects:
+            obj_x, obj_y = obj.rect.center
+            dx, dy = obj_x - x, obj_y - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < min_dist_sq and obj.health > 0:
+                nearest, min_dist_sq = obj, dist_sq
+
+        return nearest
+
     def move_toward(self) -> None:
         """Only relevant for mobile classes."""
         if not self.IS_MOBILE:
@@ -58,10 +90,12 @@ class GameObject(pg.sprite.Sprite):
             )
 
         if self.target and self.target_object and self.target_object.health > 0:
-            dist = self.distance_to(self.target)
-            if dist > self.ATTACK_RANGE:
-                if dist > GameObject.ARRIVAL_RADIUS:
-                    dx, dy = self.displacement_to(self.target)
+            dx, dy = self.displacement_to(self.target)
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > self.ATTACK_RANGE**2:
+                # Root is only taken when actually moving, to normalize the step
+                if dist_sq > GameObject.ARRIVAL_RADIUS**2:
+                    dist = dist_sq**0.5
                     self.rect.x += self.speed * dx / dist
                     self.rect.y += self.speed * dy / dist
                 self.rect.clamp_ip(pg.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT))
@@ -69,21 +103,34 @@ class GameObject(pg.sprite.Sprite):
                 self.target = None
 
         elif self.formation_target:
-            dist = self.distance_to(self.formation_target)
-            if dist > GameObject.ARRIVAL_RADIUS:
-                dx, dy = self.displacement_to(self.formation_target)
+            dx, dy = self.displacement_to(self.formation_target)
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > GameObject.ARRIVAL_RADIUS**2:
+                dist = dist_sq**0.5
                 self.rect.x += self.speed * dx / dist
                 self.rect.y += self.speed * dy / dist
             self.rect.clamp_ip(pg.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT))
 
         elif self.target:
-            dist = self.distance_to(self.target)
-            if dist > GameObject.ARRIVAL_RADIUS:
-                dx, dy = self.displacement_to(self.target)
+            dx, dy = self.displacement_to(self.target)
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > GameObject.ARRIVAL_RADIUS**2:
+                dist = dist_sq**0.5
                 self.rect.x += self.speed * dx / dist
                 self.rect.y += self.speed * dy / dist
             self.rect.clamp_ip(pg.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT))
 
+    def track_target_object(self, *, max_range: float) -> None:
+        """Aim at `target_object`'s current position while it is within `max_range`,
+        otherwise drop it. Only relevant while `target_object` has health left."""
+        target_object = self.target_object
+        if target_object and target_object.health > 0:
+            position = target_object.position
+            self.target = (
+                position if self.distance_squared_to(position) <= max_range**2 else None
+            )
+            self.target_object = target_object if self.target else None
+
     def update(self, *args, **kwargs) -> None:
         super().update(*args, **kwargs)
         if self.IS_MOBILE:
@@ -92,14 +139,38 @@ class GameObject(pg.sprite.Sprite):
         if self.cooldown_timer > 0:
             self.cooldown_timer -= 1
 
-    def draw_health_bar(self, *, surface: pg.Surface, camera: Camera) -> None:
+    def draw(self, *, surface: pg.Surface, camera: Camera) -> None:
+        screen_rect = camera.rect_to_screen(self.rect)
+        surface.blit(source=self.image, dest=screen_rect)
+        self.draw_overlays(surface=surface, screen_rect=screen_rect)
+
+    def draw_overlays(self, *, surface: pg.Surface, screen_rect: pg.Rect) -> None:
+        """Draw everything but `image` to `surface`.
+
+        Separate from `draw()`, so images of many objects can be blitted in one
+        batch first.
+
+        Args:
+            surface:
+            screen_rect:
+                `rect` translated to screen, computed once by the caller and shared
+                by all overlays.
+        """
+        if self.is_selected:
+            self.draw_selection_indicator(surface=surface, screen_rect=screen_rect)
+
+        if VIEW_DEBUG_MODE_IS_ENABLED:
+            self.draw_debug_info(surface=surface, screen_rect=screen_rect)
+
+        self.draw_health_bar(surface=surface, screen_rect=screen_rect)
+
+    def draw_health_bar(self, *, surface: pg.Surface, screen_rect: pg.Rect) -> None:
         health_ratio = self.health / self.max_health
         if not self.under_attack and health_ratio == 1.0:
             return
 
         color = (0, 255, 0) if health_ratio > 0.5 else (255, 0, 0)
         bar_width = max(10, int(self.rect.width * health_ratio))
-        screen_rect = camera.rect_to_screen(self.rect)
         pg.draw.rect(
             surface,
             (0, 0, 0),
@@ -113,20 +184,18 @@ class GameObject(pg.sprite.Sprite):
             1,
         )  # Border
 
-    def draw_debug_info(self, *, surface: pg.Surface, camera: Camera) -> None:
+    def draw_debug_info(self, *, surface: pg.Surface, screen_rect: pg.Rect) -> None:
         """Draw debug helpers to `surface`."""
-        draw_utils.debug_outline_rect(
-            surface=surface, rect=camera.rect_to_screen(self.rect)
-        )
-        draw_utils.debug_marker(
-            surface=surface, position=camera.to_screen(self.position)
-        )
+        draw_utils.debug_outline_rect(surface=surface, rect=screen_rect)
+        draw_utils.debug_marker(surface=surface, position=screen_rect.center)
 
-    def draw_selection_indicator(self, *, surface: pg.Surface, camera: Camera) -> None:
+    def draw_selection_indicator(
+        self, *, surface: pg.Surface, screen_rect: pg.Rect
+    ) -> None:
         """Draw an outline."""
         pg.draw.rect(
             surface=surface,
             color=SELECTION_INDICATOR_COLOR,
-            rect=camera.rect_to_screen(self.rect),
+            rect=screen_rect,
             width=2,
         )
@@ -4,14 +4,13 @@ from typing import TYPE_CHECKING, Literal
 
 import pygame as pg
 
-from src.constants import VIEW_DEBUG_MODE_IS_ENABLED
 from src.game_objects.game_object import GameObject
 from src.game_objects.units.infantry import Infantry
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
-    from src.camera import Camera
+    from src.game import Game
     from src.game_objects.buildings.headquarters import Headquarters
     from src.iron_field import IronField
     from src.team import Team
@@ -25,6 +24,7 @@ class Harvester(GameObject):
     COST = 800
     IS_MOBILE = True
     POWER_USAGE = 20
+    TARGET_PRIORITY = 3
     # Class-specific:
     IRON_TRANSFER_RANGE = 30
     """Distance within which iron can be harvested/delivered."""
@@ -60,17 +60,39 @@ class Harvester(GameObject):
         pg.draw.circle(self.image, (50, 50, 50), (10, 30), 5)  # Wheel 1
         pg.draw.circle(self.image, (50, 50, 50), (40, 30), 5)  # Wheel 2
 
-    def update(
-        self, *, enemy_units: Iterable[GameObject], iron_fields: Iterable[IronField]
-    ) -> None:
-        super().update()
+    def _nearest_field(self, iron_fields: Iterable[IronField]) -> IronField:
+        """Return the nearest rich field, or the nearest field if none are rich.
+
+        Found in a single pass, ranking rich fields ahead of others.
+        """
+        x, y = self.rect.center
+
+        def rank(field: IronField) -> tuple[bool, int]:
+            field_x, field_y = field.rect.center
+            dx, dy = field_x - x, field_y - y
+            return field.resources < 1000, dx * dx + dy * dy
+
+        return min(iron_fields, key=rank)
+
+    def attack(self, *, game: Game) -> None:
+        """Attack the nearest enemy infantry in range, if off cooldown.
+
+        Queries `game.spatial_index`, so call after it has been refreshed for this
+        frame's movement.
+        """
         if self.cooldown_timer == 0:
-            closest_target, min_dist = None, float("inf")
-            for u in enemy_units:
-                if u.health > 0 and isinstance(u, Infantry):
-                    dist = self.distance_to(u.position)
-                    if dist < Harvester.ATTACK_RANGE and dist < min_dist:
-                        closest_target, min_dist = u, dist
+            closest_target = self.nearest(
+                (
+                    u
+                    for u in game.enemy_units_within(
+                        team=self.team,
+                        position=self.rect.center,
+                        radius=Harvester.ATTACK_RANGE,
+                    )
+                    if isinstance(u, Infantry)
+                ),
+                max_range=Harvester.ATTACK_RANGE,
+            )
 
             if closest_target:
                 closest_target.health -= self.attack_damage
@@ -78,22 +100,17 @@ class Harvester(GameObject):
                     closest_target.kill()
                 self.cooldown_timer = self.attack_cooldown
 
+    def update(self, *, game: Game) -> None:
+        super().update()
         if self.state == "MOVING_TO_FIELD":
             if not self.target_field or self.target_field.resources <= 0:
-                rich_fields = [f for f in iron_fields if f.resources >= 1000]
-                if rich_fields:
-                    self.target_field = min(
-                        rich_fields,
-                        key=lambda f: self.distance_to(f.position),
-                    )
-                else:
-                    self.target_field = min(
-                        iron_fields,
-                        key=lambda f: self.distance_to(f.position),
-                    )
+                self.target_field = self._nearest_field(game.iron_fields)
             if self.target_field:
                 self.target = self.target_field.position
-                if self.distance_to(self.target) < Harvester.IRON_TRANSFER_RANGE:
+                if (
+                    self.distance_squared_to(self.target)
+                    < Harvester.IRON_TRANSFER_RANGE**2
+                ):
                     self.state = "HARVESTING"
                     self.target = None
                     self.harvest_time = 40
@@ -118,27 +135,18 @@ class Harvester(GameObject):
                     f"Harvester RETURNING_TO_HQ has no target.\n{self}"
                 )  # Temporary handling, review later
 
-            if self.distance_to(self.target) < Harvester.IRON_TRANSFER_RANGE:
+            if self.distance_squared_to(self.target) < Harvester.IRON_TRANSFER_RANGE**2:
                 self.team.iron += self.iron
                 self.iron = 0
                 self.state = "MOVING_TO_FIELD"
                 self.target = None
 
-    def draw(self, *, surface: pg.Surface, camera: Camera) -> None:
-        _blit_pos = camera.to_screen(self.rect.topleft)
-        surface.blit(source=self.image, dest=_blit_pos)
-        if self.is_selected:
-            self.draw_selection_indicator(surface=surface, camera=camera)
-
-        if VIEW_DEBUG_MODE_IS_ENABLED:
-            self.draw_debug_info(surface=surface, camera=camera)
-
-        self.draw_health_bar(surface=surface, camera=camera)
+    def draw_overlays(self, *, surface: pg.Surface, screen_rect: pg.Rect) -> None:
+        super().draw_overlays(surface=surface, screen_rect=screen_rect)
         if self.iron > 0:
             _label = self.font.render(
                 text=f"Iron: {self.iron}",
                 antialias=True,
                 color=(255, 255, 255),
             )
-            _label_pos = _blit_pos + (0, -35)
-            surface.blit(source=_label, dest=_label_pos)
+            surface.blit(source=_label, dest=screen_rect.move(0, -35))
@@ -1,16 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import pygame as pg
 
-from src.constants import VIEW_DEBUG_MODE_IS_ENABLED
 from src.game_objects.game_object import GameObject
 from src.team import Faction, Team
 
-if TYPE_CHECKING:
-    from src.camera import Camera
-
 
 class Infantry(GameObject):
     """Basic foot soldier."""
@@ -43,23 +37,4 @@ class Infantry(GameObject):
 
     def update(self) -> None:
         super().update()
-        if self.target_object and self.target_object.health > 0:
-            if (
-                self.distance_to(self.target_object.position)
-                <= Infantry.UNIT_TARGETING_RANGE
-            ):
-                self.target = self.target_object.position
-            else:
-                self.target = None
-
-            self.target_object = self.target_object if self.target else None
-
-    def draw(self, *, surface: pg.Surface, camera: Camera) -> None:
-        surface.blit(source=self.image, dest=camera.to_screen(self.rect.topleft))
-        if self.is_selected:
-            self.draw_selection_indicator(surface=surface, camera=camera)
-
-        if VIEW_DEBUG_MODE_IS_ENABLED:
-            self.draw_debug_info(surface=surface, camera=camera)
-
-        self.draw_health_bar(surface=surface, camera=camera)
+        self.track_target_object(max_range=Infantry.UNIT_TARGETING_RANGE)
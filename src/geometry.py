@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import math
-from statistics import fmean
 from typing import TYPE_CHECKING
 
 import pygame as pg
@@ -16,6 +15,39 @@ if TYPE_CHECKING:
 
 Coordinate = pg.Vector2
 
+_COS = tuple(math.cos(math.radians(degrees)) for degrees in range(360))
+_SIN = tuple(math.sin(math.radians(degrees)) for degrees in range(360))
+
+
+def unit_vector(degrees: float) -> tuple[float, float]:
+    """Return `(cos, sin)` of `degrees`, to the nearest whole degree.
+
+    Looked up from precomputed tables, so cheaper than `math.cos()` and
+    `math.sin()` where whole-degree precision is enough.
+    """
+    i = round(degrees) % 360
+    return _COS[i], _SIN[i]
+
+
+def heading(origin: pg.typing.Point, target: pg.typing.Point) -> float:
+    """Return direction (degrees) from `origin` to `target`, as
+    `Vector2.as_polar()` would, but without allocating vectors."""
+    return math.degrees(math.atan2(target[1] - origin[1], target[0] - origin[0]))
+
+
+ANGLE_STEPS = 64
+"""Number of discrete angles per full turn at which rotated images are cached."""
+
+
+def snap_angle(degrees: float) -> float:
+    """Return `degrees` rounded to the nearest of `ANGLE_STEPS` angles, in
+    `[0, 360)`.
+
+    Rotated images are cached by angle and shared between objects, so pass angles
+    through this first to bound those caches.
+    """
+    return round(degrees * ANGLE_STEPS / 360) % ANGLE_STEPS * 360 / ANGLE_STEPS
+
 
 def snap_to_grid(position: pg.typing.Point) -> Coordinate:
     """Return minimum (top left) point of tile containing `position`."""
@@ -54,6 +86,20 @@ def calculate_formation_positions(
     return positions
 
 
-def mean_vector(vecs: Iterable[pg.Vector2]) -> pg.Vector2:
-    """Return mean vector of `vecs`."""
-    return pg.Vector2(fmean(vec.x for vec in vecs), fmean(vec.y for vec in vecs))
+def mean_vector(points: Iterable[pg.typing.Point]) -> pg.Vector2:
+    """Return mean vector of `points`, summing both axes in a single pass.
+
+    Raises:
+        ValueError: if `points` is empty.
+    """
+    sum_x = sum_y = 0.0
+    count = 0
+    for point in points:
+        sum_x += point[0]
+        sum_y += point[1]
+        count += 1
+
+    if not count:
+        raise ValueError("mean_vector requires at least one point")
+
+    return pg.Vector2(sum_x / count, sum_y / count)
@@ -1,21 +1,57 @@
 from __future__ import annotations
 
+import random
+from functools import cache
 from typing import TYPE_CHECKING
 
 import pygame as pg
 
 from src import draw_utils
 from src.constants import VIEW_DEBUG_MODE_IS_ENABLED
-from src.geometry import Coordinate
 
 if TYPE_CHECKING:
     from src.camera import Camera
+    from src.fog_of_war import FogOfWar
 
 
-class Particle(pg.sprite.Sprite):
-    """For effects like explosions or muzzle flash."""
+@cache
+def _particle_image(*, size: int, color: tuple[int, ...]) -> pg.Surface:
+    """Return circle image. Shared, so alpha is applied at draw time."""
+    image = pg.Surface((size, size), pg.SRCALPHA)
+    pg.draw.circle(image, color, (size // 2, size // 2), size // 2)
+    return image
 
-    def __init__(
+
+class ParticlePool:
+    """Fixed-capacity ring buffer of particles, for effects like explosions or
+    muzzle flash.
+
+    Particle state is held as parallel lists (structure of arrays), indexed by slot.
+    Spawning reuses the next slot, overwriting the oldest particle if the pool is
+    full, so nothing is allocated per particle after construction.
+    """
+
+    CAPACITY = 1024
+
+    def __init__(self) -> None:
+        self._x: list[float] = [0] * self.CAPACITY
+        """Center x."""
+        self._y: list[float] = [0] * self.CAPACITY
+        """Center y."""
+        self._vx: list[float] = [0] * self.CAPACITY
+        self._vy: list[float] = [0] * self.CAPACITY
+        self._lifetime: list[int] = [0] * self.CAPACITY
+        self._initial_lifetime: list[int] = [1] * self.CAPACITY
+        self._size: list[int] = [0] * self.CAPACITY
+        self._image: list[pg.Surface | None] = [None] * self.CAPACITY
+        self._live: list[int] = []
+        """Slots of live particles."""
+        self._next_slot = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def spawn(
         self,
         position: pg.typing.Point,
         vx: float,
@@ -24,35 +60,131 @@ class Particle(pg.sprite.Sprite):
         color: pg.Color,
         lifetime: int,
     ) -> None:
-        super().__init__()
-        self.image: pg.Surface = pg.Surface((size, size), pg.SRCALPHA)
-        pg.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
-        self.rect: pg.Rect = self.image.get_rect(center=position)
-        self.vx, self.vy = vx, vy
-        self.lifetime = lifetime
-        self.alpha = 255
-        self.initial_lifetime = lifetime
-
-    @property
-    def position(self) -> Coordinate:
-        return Coordinate(self.rect.center)
+        """Spawn a particle centered on `position`."""
+        i = self._next_slot
+        self._next_slot = (i + 1) % self.CAPACITY
+        if self._lifetime[i] <= 0:
+            self._live.append(i)
+
+        self._x[i], self._y[i] = position[0], position[1]
+        self._vx[i], self._vy[i] = vx, vy
+        self._lifetime[i] = self._initial_lifetime[i] = lifetime
+        self._size[i] = size
+        self._image[i] = _particle_image(size=size, color=tuple(color))
+
+    def spawn_burst(
+        self,
+        position: pg.typing.Point,
+        *,
+        count: int,
+        speed: float,
+        size: int | tuple[int, int],
+        color: pg.Color,
+        lifetime: int,
+    ) -> None:
+        """Spawn `count` particles centered on `position`, each with a random velocity
+        of up to `speed` on each axis.
+
+        Args:
+            position:
+            count:
+            speed:
+            size:
+                Fixed, or an inclusive `(min, max)` range to pick from per particle.
+            color:
+            lifetime:
+        """
+        x, y = position[0], position[1]
+        min_size, max_size = (size, size) if isinstance(size, int) else size
+        size_span = max_size - min_size + 1
+        velocity_span = 2 * speed
+        # `random.random()` with inline scaling avoids the Python-level overhead
+        # of `uniform()` / `randint()`, called several times per particle.
+        rand = random.random
+        # Images looked up once per burst, not per particle
+        color_key = tuple(color)
+        images = [
+            _particle_image(size=particle_size, color=color_key)
+            for particle_size in range(min_size, max_size + 1)
+        ]
+        xs, ys, vxs, vys = self._x, self._y, self._vx, self._vy
+        lifetimes, initial_lifetimes, live = (
+            self._lifetime,
+            self._initial_lifetime,
+            self._live,
+        )
+        sizes, slot_images = self._size, self._image
+        i = self._next_slot
+        for _ in range(count):
+            if lifetimes[i] <= 0:
+                live.append(i)
+
+            xs[i], ys[i] = x, y
+            vxs[i] = rand() * velocity_span - speed
+            vys[i] = rand() * velocity_span - speed
+            lifetimes[i] = initial_lifetimes[i] = lifetime
+            size_index = 0 if size_span == 1 else int(rand() * size_span)
+            sizes[i] = min_size + size_index
+            slot_images[i] = images[size_index]
+            i = (i + 1) % self.CAPACITY
+
+        self._next_slot = i
 
     def update(self) -> None:
-        self.rect.x += self.vx
-        self.rect.y += self.vy
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
-        else:
-            self.alpha = int(255 * self.lifetime / self.initial_lifetime)
-            self.image.set_alpha(self.alpha)
-
-    def draw(self, *, surface: pg.Surface, camera: Camera) -> None:
-        surface.blit(source=self.image, dest=camera.to_screen(self.rect.topleft))
-        if VIEW_DEBUG_MODE_IS_ENABLED:
-            draw_utils.debug_outline_rect(
-                surface=surface, rect=camera.rect_to_screen(self.rect)
-            )
-            draw_utils.debug_marker(
-                surface=surface, position=camera.to_screen(self.position)
-            )
+        """Move live particles and age them, releasing expired slots."""
+        xs, ys, vxs, vys = self._x, self._y, self._vx, self._vy
+        lifetimes = self._lifetime
+        for i in self._live:
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            lifetimes[i] -= 1
+
+        self._live = [i for i in self._live if lifetimes[i] > 0]
+
+    def draw(
+        self, *, surface: pg.Surface, camera: Camera, fog_of_war: FogOfWar | None
+    ) -> None:
+        """Draw live particles within the camera viewport, fading with age.
+
+        Args:
+            surface:
+            camera:
+            fog_of_war:
+                If given, particles outside visible tiles are not drawn.
+        """
+        offset_x, offset_y = camera.map_offset
+        is_visible = fog_of_war.is_visible if fog_of_war else None
+        view_left, view_top, view_right, view_bottom = (
+            camera.viewport.left,
+            camera.viewport.top,
+            camera.viewport.right,
+            camera.viewport.bottom,
+        )
+        for i in self._live:
+            image = self._image[i]
+            if image is None:
+                continue
+
+            x, y = self._x[i], self._y[i]
+            half_size = self._size[i] // 2
+            if (
+                x + half_size < view_left
+                or x - half_size > view_right
+                or y + half_size < view_top
+                or y - half_size > view_bottom
+            ):
+                continue
+
+            if is_visible and not is_visible((x, y)):
+                continue
+
+            image.set_alpha(int(255 * self._lifetime[i] / self._initial_lifetime[i]))
+            dest = x - half_size + offset_x, y - half_size + offset_y
+            surface.blit(source=image, dest=dest)
+            if VIEW_DEBUG_MODE_IS_ENABLED:
+                draw_utils.debug_outline_rect(
+                    surface=surface, rect=(dest, (self._size[i], self._size[i]))
+                )
+                draw_utils.debug_marker(
+                    surface=surface, position=(x + offset_x, y + offset_y)
+                )
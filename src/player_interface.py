@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import InitVar, dataclass
 from dataclasses import field as dataclass_field
+from functools import cache
 from typing import TYPE_CHECKING, ClassVar
 
 import pygame as pg
@@ -26,14 +27,31 @@ from src.game_objects.units.tank import Tank
 from src.team import Faction, Team
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable
 
     from src.camera import Camera
     from src.game import Game
-    from src.game_objects.buildings.building import Building
     from src.game_objects.game_object import GameObject
 
 
+@cache
+def _placement_ghost(
+    *,
+    size: tuple[int, int],
+    fill_color: tuple[int, ...],
+    border_color: tuple[int, int, int],
+) -> pg.Surface:
+    """Return translucent preview image of a building being placed.
+
+    Only a few size, faction and validity combinations exist, so each is drawn once.
+    """
+    ghost = pg.Surface(size, pg.SRCALPHA)
+    ghost.fill(fill_color)
+    ghost.set_alpha(100)
+    pg.draw.rect(ghost, border_color, ((0, 0), size), width=3)
+    return ghost
+
+
 @dataclass(kw_only=True)
 class PlayerInterface:
     """Interface for player."""
@@ -64,6 +82,11 @@ class PlayerInterface:
     ACTION_ALLOWED_COLOR: ClassVar = pg.Color(0, 200, 0)
     ACTION_BLOCKED_COLOR: ClassVar = pg.Color(200, 0, 0)
     MAX_PRODUCTION_QUEUE_LENGTH: ClassVar = 5
+    _PRODUCTION_QUEUE_ROWS_Y: ClassVar = tuple(
+        20 + i * 25 for i in range(MAX_PRODUCTION_QUEUE_LENGTH)
+    )
+    """y offsets of production queue rows, relative to the progress bar."""
+    MAX_TEXT_CACHE_SIZE: ClassVar = 256
     PLACEMENT_VALID_COLOR = (0, 255, 0)
     PLACEMENT_INVALID_COLOR = (255, 0, 0)
 
@@ -86,10 +109,14 @@ class PlayerInterface:
     sell_button: pg.Rect = dataclass_field(init=False)
     current_tab = "Units"
     production_timer: float | None = dataclass_field(init=False, default=None)
-    all_buildings: InitVar[Iterable[Building]]
+    game: InitVar[Game]
     font: pg.Font
+    _text_cache: dict[tuple[str, tuple[int, ...]], pg.Surface] = dataclass_field(
+        init=False, default_factory=dict
+    )
+    """Rendered text, by text and color. See `_render()`."""
 
-    def __post_init__(self, all_buildings: Iterable[Building]) -> None:
+    def __post_init__(self, game: Game) -> None:
         self.surface = pg.Surface((PlayerInterface.WIDTH, SCREEN_HEIGHT))
 
         tab_button_base = pg.Rect(
@@ -111,24 +138,15 @@ class PlayerInterface:
             [
                 (
                     Tank,
-                    lambda: any(
-                        b.team == self.hq.team and isinstance(b, WarFactory)
-                        for b in all_buildings
-                    ),
+                    lambda: game.team_count(self.hq.team, WarFactory) > 0,
                 ),
                 (
                     Infantry,
-                    lambda: any(
-                        b.team == self.team and isinstance(b, Barracks)
-                        for b in all_buildings
-                    ),
+                    lambda: game.team_count(self.team, Barracks) > 0,
                 ),
                 (
                     Harvester,
-                    lambda: any(
-                        b.team == self.team and isinstance(b, WarFactory)
-                        for b in all_buildings
-                    ),
+                    lambda: game.team_count(self.team, WarFactory) > 0,
                 ),
             ]
         ):
@@ -148,7 +166,7 @@ class PlayerInterface:
             )
         self.buy_buttons["Defensive"] = {Turret: (buy_button_base, lambda: True)}
         self.sell_button = action_button_base.move(0, self.SELL_BUTTON_POS_Y)
-        self.object_button_labels = {
+        self.object_button_labels: dict[type[GameObject], str] = {
             Tank: "Tank",
             Infantry: "Infantry",
             Harvester: "Harvester",
@@ -158,42 +176,94 @@ class PlayerInterface:
             Headquarters: "Headquarters",
             Turret: "Turret",
         }
+        # Static surfaces, so rendered once here
+        self.tab_labels = {
+            tab_name: self.font.render(
+                tab_name, color=pg.Color("white"), antialias=True
+            )
+            for tab_name in self.tab_buttons
+        }
+        """Tab button label surfaces."""
+        self.buy_button_labels = {
+            cls: self.font.render(
+                f"{label} ({cls.COST})", color=pg.Color("white"), antialias=True
+            )
+            for cls, label in self.object_button_labels.items()
+        }
+        """Buy button label surfaces, including cost."""
+        self.production_queue_labels = {
+            cls: self.font.render(
+                f"{cls.__name__} ({cls.COST})", color=pg.Color("white"), antialias=True
+            )
+            for cls in self.object_button_labels
+        }
+        """Production queue label surfaces."""
+        self.backgrounds = {
+            tab_name: self._render_background(active_tab=tab_name)
+            for tab_name in self.tab_buttons
+        }
+        """Panel fill, border and tab buttons, by active tab."""
+
+    def _render_background(self, *, active_tab: str) -> pg.Surface:
+        """Return the static part of the panel, as drawn while `active_tab` is
+        selected."""
+        background = pg.Surface(self.surface.get_size())
+        background.fill(self.FILL_COLOR)
+        pg.draw.rect(background, self.LINE_COLOR, background.get_rect(), width=2)
+        for tab_name, rect in self.tab_buttons.items():
+            self._draw_tab_button(
+                surface=background,
+                rect=rect,
+                label=tab_name,
+                is_active=tab_name == active_tab,
+            )
+
+        return background
 
     @staticmethod
     def _local_pos(screen_pos: pg.typing.IntPoint) -> tuple[int, int]:
         """Convert screen position to local position."""
         return screen_pos[0] - SCREEN_WIDTH + PlayerInterface.WIDTH, screen_pos[1]
 
+    def _render(self, text: str, color: pg.Color) -> pg.Surface:
+        """Return `text` rendered in `color`, reusing earlier renders.
+
+        Most labels are static, and iron and power values change rarely, so text is
+        rasterized only when it changes. The cache is cleared when full, rather than
+        growing with every value seen.
+        """
+        key = text, tuple(color)
+        if key not in self._text_cache:
+            if len(self._text_cache) >= self.MAX_TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            self._text_cache[key] = self.font.render(text, color=color, antialias=True)
+
+        return self._text_cache[key]
+
     def _draw_iron(self, *, y_pos: int) -> None:
-        _label = self.font.render(
-            f"Iron: {self.team.iron}",
-            color=pg.Color("white"),
-            antialias=True,
-        )
+        _label = self._render(f"Iron: {self.team.iron}", pg.Color("white"))
         self.surface.blit(source=_label, dest=(self.MARGIN_X, y_pos))
 
     def _draw_power(self, *, y_pos: int) -> None:
         color_ = pg.Color("green") if self.hq.has_enough_power else pg.Color("red")
         self.surface.blit(
-            self.font.render(
-                f"Power: {self.hq.power_output}/{self.hq.power_usage}",
-                color=color_,
-                antialias=True,
+            self._render(
+                f"Power: {self.hq.power_output}/{self.hq.power_usage}", color_
             ),
             (self.MARGIN_X, y_pos),
         )
 
-    def _draw_tab_button(self, *, rect: pg.Rect, label: str) -> None:
+    def _draw_tab_button(
+        self, *, surface: pg.Surface, rect: pg.Rect, label: str, is_active: bool
+    ) -> None:
         pg.draw.rect(
-            self.surface,
-            self.ACTIVE_TAB_COLOR
-            if label == self.current_tab
-            else self.INACTIVE_TAB_COLOR,
+            surface,
+            self.ACTIVE_TAB_COLOR if is_active else self.INACTIVE_TAB_COLOR,
             rect,
             border_radius=self.BUTTON_RADIUS,
         )
-        self.surface.blit(
-            self.font.render(label, color=pg.Color("white"), antialias=True),
+        surface.blit(
+            self.tab_labels[label],
             (rect.x + 10, rect.y + 10),
         )
 
@@ -208,11 +278,7 @@ class PlayerInterface:
             self.surface, buy_fill_color, rect, border_radius=self.BUTTON_RADIUS
         )
         self.surface.blit(
-            self.font.render(
-                f"{self.object_button_labels[cls]} ({cls.COST})",
-                color=pg.Color("white"),
-                antialias=True,
-            ),
+            self.buy_button_labels[cls],
             (rect.x + 10, rect.y + 10),
         )
 
@@ -229,15 +295,13 @@ class PlayerInterface:
             border_radius=self.BUTTON_RADIUS,
         )
         self.surface.blit(
-            self.font.render("Sell", color=pg.Color("white"), antialias=True),
+            self._render("Sell", pg.Color("white")),
             (self.sell_button.x + 10, self.sell_button.y + 10),
         )
 
     def _draw_production_queue(self, *, y_pos: int, game: Game) -> None:
         if self.hq.production_timer and self.hq.production_queue:
-            progress = 1 - self.hq.production_timer / game.get_production_time(
-                cls=self.hq.production_queue[0], team=self.team
-            )
+            progress = 1 - self.hq.production_timer / self.hq.production_time
             draw_progress_bar(
                 surface=self.surface,
                 bar_color=pg.Color("green"),
@@ -248,14 +312,11 @@ class PlayerInterface:
                 progress=progress,
             )
 
-        for i, cls in enumerate(self.hq.production_queue[:5]):
+        for cls, row_y in zip(
+            self.hq.production_queue, self._PRODUCTION_QUEUE_ROWS_Y, strict=False
+        ):
             self.surface.blit(
-                self.font.render(
-                    f"{cls.__name__} ({cls.COST})",
-                    color=pg.Color("white"),
-                    antialias=True,
-                ),
-                (self.MARGIN_X, (y_pos + 20) + i * 25),
+                self.production_queue_labels[cls], (self.MARGIN_X, y_pos + row_y)
             )
 
     def _draw_pending_building(
@@ -270,9 +331,6 @@ class PlayerInterface:
             raise TypeError("No pending building")
 
         world_pos = geometry.snap_to_grid(camera.to_world(mouse_pos))
-        temp_surface = pg.Surface(self.hq.pending_building.SIZE, pg.SRCALPHA)
-        temp_surface.fill(GDI_COLOR if self.team.faction == Faction.GDI else NOD_COLOR)
-        temp_surface.set_alpha(100)
         color_ = self.PLACEMENT_INVALID_COLOR
         if game.is_valid_building_position(
             position=world_pos,
@@ -281,14 +339,14 @@ class PlayerInterface:
         ):
             color_ = self.PLACEMENT_VALID_COLOR
 
-        pg.draw.rect(
-            temp_surface,
-            color_,
-            ((0, 0), self.hq.pending_building.SIZE),
-            width=3,
-        )
         surface_.blit(
-            temp_surface,
+            _placement_ghost(
+                size=self.hq.pending_building.SIZE,
+                fill_color=tuple(
+                    GDI_COLOR if self.team.faction == Faction.GDI else NOD_COLOR
+                ),
+                border_color=color_,
+            ),
             (
                 mouse_pos[0] - self.hq.pending_building.SIZE[0] // 2,
                 mouse_pos[1] - self.hq.pending_building.SIZE[1] // 2,
@@ -297,14 +355,10 @@ class PlayerInterface:
 
     def draw(self, *, surface: pg.Surface, game: Game, camera: Camera) -> None:
         """Draw to the `surface_`."""
-        self.surface.fill(self.FILL_COLOR)
-        pg.draw.rect(self.surface, self.LINE_COLOR, self.surface.get_rect(), width=2)
+        self.surface.blit(self.backgrounds[self.current_tab], (0, 0))
         self._draw_iron(y_pos=self.IRON_POS_Y)
         self._draw_power(y_pos=self.POWER_POS_Y)
 
-        for tab_name, rect in self.tab_buttons.items():
-            self._draw_tab_button(rect=rect, label=tab_name)
-
         for cls, info in self.buy_buttons[self.current_tab].items():
             rect, req_fn = info
             self._draw_buy_button(rect=rect, cls=cls, req_fn=req_fn)
@@ -334,7 +388,7 @@ class PlayerInterface:
         for cls, info in self.buy_buttons[self.current_tab].items():
             rect, req_fn = info
             if rect.collidepoint(local_pos) and self.team.iron >= cls.COST and req_fn():
-                self.hq.production_queue.append(cls)
+                self.hq.enqueue(cls)
                 self.team.iron -= cls.COST
                 if not self.hq.production_timer:
                     self.production_timer = game.get_production_time(
@@ -1,28 +1,38 @@
 from __future__ import annotations
 
-import math
 import random
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING
 
 import pygame as pg
 
 from src import draw_utils
 from src.constants import VIEW_DEBUG_MODE_IS_ENABLED
-from src.geometry import Coordinate
-from src.particle import Particle
+from src.geometry import Coordinate, snap_angle
 
 if TYPE_CHECKING:
     from src.camera import Camera
     from src.game_objects.game_object import GameObject
+    from src.particle import ParticlePool
     from src.team import Team
 
 HIT_RADIUS = 3
 
 
+@cache
+def _shell_image(*, angle: float) -> pg.Surface:
+    """Return shell image facing `angle` (degrees)."""
+    image = pg.Surface((10, 5), pg.SRCALPHA)
+    pg.draw.ellipse(image, (255, 200, 0), (0, 0, 10, 5))
+    return pg.transform.rotate(image, -angle)
+
+
 class Projectile(pg.sprite.Sprite):
     """For ranged attacks e.g. tank shells."""
 
     SPEED: float = 6
+    TRAIL_INTERVAL = 3
+    """Frames between trail particles."""
 
     def __init__(
         self,
@@ -32,56 +42,53 @@ class Projectile(pg.sprite.Sprite):
         team: Team,
     ) -> None:
         super().__init__()
-        self.image: pg.Surface = pg.Surface((10, 5), pg.SRCALPHA)
+        self.image: pg.Surface = _shell_image(angle=0)
         self.rect: pg.Rect = self.image.get_rect(center=position)
         self.target_unit = target_unit
         self.damage = damage
         self.team = team
-        self.particle_timer = 2
-        pg.draw.ellipse(self.image, (255, 200, 0), (0, 0, 10, 5))
 
     @property
     def position(self) -> Coordinate:
         return Coordinate(self.rect.center)
 
-    def update(self, particles: pg.sprite.Group[Any]) -> None:
+    def update(self, particles: ParticlePool, frame_count: int) -> None:
+        """Move toward target, hitting it when in range.
+
+        Args:
+            particles:
+            frame_count:
+                Trail particles are spawned on frames that are a multiple of
+                `TRAIL_INTERVAL`, in step for all projectiles, so no per-projectile
+                timer is needed.
+        """
         if self.target_unit and self.target_unit.health > 0:
-            if self.position.distance_to(self.target_unit.position) > HIT_RADIUS:
-                d = self.target_unit.position - self.position
-                angle = math.atan2(d.y, d.x)
-                self.image = pg.transform.rotate(
-                    pg.Surface((10, 5), pg.SRCALPHA), -math.degrees(angle)
-                )
-                pg.draw.ellipse(self.image, (255, 200, 0), (0, 0, 10, 5))
-                self.rect.x += self.SPEED * math.cos(angle)
-                self.rect.y += self.SPEED * math.sin(angle)
-                if self.particle_timer <= 0:
-                    particles.add(
-                        Particle(
-                            self.position,
-                            -math.cos(angle) * random.uniform(0.5, 1.5),
-                            -math.sin(angle) * random.uniform(0.5, 1.5),
-                            5,
-                            pg.Color(255, 255, 150),
-                            15,
-                        )
+            d = self.target_unit.position - self.position
+            dist, angle = d.as_polar()
+            if dist > HIT_RADIUS:
+                direction = d / dist
+                self.image = _shell_image(angle=snap_angle(angle))
+                self.rect.x += self.SPEED * direction.x
+                self.rect.y += self.SPEED * direction.y
+                if not frame_count % Projectile.TRAIL_INTERVAL:
+                    particles.spawn(
+                        self.position,
+                        -direction.x * (0.5 + random.random()),
+                        -direction.y * (0.5 + random.random()),
+                        5,
+                        pg.Color(255, 255, 150),
+                        15,
                     )
-                    self.particle_timer = 2
-                else:
-                    self.particle_timer -= 1
             else:
                 self.kill()
-                for _ in range(5):
-                    particles.add(
-                        Particle(
-                            self.position,
-                            random.uniform(-2, 2),
-                            random.uniform(-2, 2),
-                            6,
-                            pg.Color(255, 100, 0),
-                            15,
-                        )
-                    )  # Orange explosion
+                particles.spawn_burst(
+                    self.position,
+                    count=5,
+                    speed=2,
+                    size=6,
+                    color=pg.Color(255, 100, 0),
+                    lifetime=15,
+                )  # Orange explosion
         else:
             self.kill()
 
@@ -0,0 +1,151 @@
+"""Uniform grid spatial index for sprites."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, TypeVar
+
+import pygame as pg
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from src.game_objects.game_object import GameObject
+    from src.iron_field import IronField
+
+_SpriteT = TypeVar("_SpriteT", bound="GameObject | IronField")
+
+
+class SpatialHash(pg.sprite.AbstractGroup[_SpriteT]):
+    """Sprite group which also buckets its sprites into a uniform grid of square
+    cells, keyed by the cells overlapped by each sprite's `rect`.
+
+    Killed sprites are removed from the grid automatically. Sprites that move must
+    be re-bucketed with `refresh()` (or `rebuild()`).
+    """
+
+    CELL_SIZE: ClassVar[int] = 64
+    REBUILD_FRACTION: ClassVar[float] = 0.5
+    """`refresh()` falls back to `rebuild()` when more than this fraction of sprites
+    have changed cells."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cells: dict[tuple[int, int], list[_SpriteT]] = {}
+        self._sprite_cells: dict[_SpriteT, list[tuple[int, int]]] = {}
+
+    @classmethod
+    def _cell_range(cls, rect: pg.Rect) -> tuple[range, range]:
+        """Return ranges of cell x and y indices overlapped by `rect`."""
+        return (
+            range(rect.left // cls.CELL_SIZE, rect.right // cls.CELL_SIZE + 1),
+            range(rect.top // cls.CELL_SIZE, rect.bottom // cls.CELL_SIZE + 1),
+        )
+
+    def _insert(self, sprite: _SpriteT) -> None:
+        cell_xs, cell_ys = self._cell_range(sprite.rect)
+        keys = [(cell_x, cell_y) for cell_x in cell_xs for cell_y in cell_ys]
+        for key in keys:
+            self.cells.setdefault(key, []).append(sprite)
+
+        self._sprite_cells[sprite] = keys
+
+    @staticmethod
+    def _ring(cell_x: int, cell_y: int, ring: int) -> Iterator[tuple[int, int]]:
+        """Yield keys of cells `ring` cells away from `(cell_x, cell_y)` on either or
+        both axes, i.e. the square ring of cells around it."""
+        if not ring:
+            yield cell_x, cell_y
+            return
+
+        for dx in range(-ring, ring + 1):
+            yield cell_x + dx, cell_y - ring
+            yield cell_x + dx, cell_y + ring
+        for dy in range(-ring + 1, ring):
+            yield cell_x - ring, cell_y + dy
+            yield cell_x + ring, cell_y + dy
+
+    def add_internal(self, sprite: _SpriteT, layer: int | None = None) -> None:
+        super().add_internal(sprite, layer)
+        self._insert(sprite)
+
+    def remove_internal(self, sprite: _SpriteT) -> None:
+        super().remove_internal(sprite)
+        for key in self._sprite_cells.pop(sprite):
+            self.cells[key].remove(sprite)
+
+    def rebuild(self) -> None:
+        """Re-bucket all sprites from their current `rect`s."""
+        self.cells.clear()
+        self._sprite_cells.clear()
+        for sprite in self.spritedict:
+            self._insert(sprite)
+
+    def refresh(self) -> None:
+        """Re-bucket only sprites whose `rect` now overlaps different cells.
+
+        Most sprites stay within the same cells from frame to frame, so this is
+        usually much cheaper than `rebuild()`.
+        """
+        moved = []
+        for sprite, keys in self._sprite_cells.items():
+            cell_xs, cell_ys = self._cell_range(sprite.rect)
+            if keys[0] != (cell_xs[0], cell_ys[0]) or keys[-1] != (
+                cell_xs[-1],
+                cell_ys[-1],
+            ):
+                moved.append(sprite)
+
+        if len(moved) > len(self._sprite_cells) * self.REBUILD_FRACTION:
+            self.rebuild()
+            return
+
+        for sprite in moved:
+            for key in self._sprite_cells[sprite]:
+                self.cells[key].remove(sprite)
+            self._insert(sprite)
+
+    def query_rect(self, rect: pg.Rect) -> list[_SpriteT]:
+        """Return sprites whose `rect` collides with `rect`."""
+        candidates: dict[_SpriteT, None] = {}
+        cell_xs, cell_ys = self._cell_range(rect)
+        for cell_x in cell_xs:
+            for cell_y in cell_ys:
+                candidates.update(dict.fromkeys(self.cells.get((cell_x, cell_y), ())))
+
+        return [s for s in candidates if rect.colliderect(s.rect)]
+
+    def nearest(
+        self,
+        position: pg.typing.Point,
+        *,
+        max_distance: float,
+        predicate: Callable[[_SpriteT], bool],
+    ) -> _SpriteT | None:
+        """Return the sprite centered nearest to `position`, within `max_distance`,
+        for which `predicate` is true, or None.
+
+        Cells are searched in rings outward from `position`, stopping once no
+        unsearched cell can hold a nearer sprite center. So where sprites are dense,
+        usually only the nearest few cells are searched.
+        """
+        x, y = position[0], position[1]
+        size = self.CELL_SIZE
+        cell_x, cell_y = int(x // size), int(y // size)
+        nearest, min_dist_sq = None, max_distance**2
+        for ring in range(int(max_distance // size) + 2):
+            # Sprite centers in this ring or beyond are at least this far away
+            if nearest is not None and min_dist_sq <= ((ring - 1) * size) ** 2:
+                break
+
+            for key in self._ring(cell_x, cell_y, ring):
+                for sprite in self.cells.get(key, ()):
+                    sprite_x, sprite_y = sprite.rect.center
+                    dx, dy = sprite_x - x, sprite_y - y
+                    dist_sq = dx * dx + dy * dy
+                    if (
+                        dist_sq < min_dist_sq
+                        or (nearest is None and dist_sq == min_dist_sq)
+                    ) and predicate(sprite):
+                        nearest, min_dist_sq = sprite, dist_sq
+
+        return nearest